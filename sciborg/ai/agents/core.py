@@ -44,6 +44,7 @@ from sciborg.ai.prompts.agent import (
 )
 from sciborg.ai.tools.core import LinqxTool
 from sciborg.ai.agents.rag_agent import rag_agent
+from sciborg.ai.agents.newcore import ParallelToolsAgentExecutor
 
 
 def command_to_tool(
@@ -91,6 +92,8 @@ def create_sciborg_chat_agent(
     handle_tool_error: bool = True,
     verbose: bool = False,
     return_intermediate_steps: bool = False,
+    parallel_tool_execution: bool = True,
+    max_parallel_tools: int = 5,
     **agent_executor_kwargs
 ) -> AgentExecutor:
     """
@@ -122,6 +125,8 @@ def create_sciborg_chat_agent(
         handle_tool_error: Enable error handling in tools
         verbose: Enable verbose logging
         return_intermediate_steps: Return intermediate steps in response
+        parallel_tool_execution: Run independent parallel tool calls concurrently
+        max_parallel_tools: Cap on concurrently running tool calls
         **agent_executor_kwargs: Additional kwargs for AgentExecutor
         
     Returns:
@@ -195,16 +200,18 @@ def create_sciborg_chat_agent(
         template=prompt_template,
     )
 
-    # Build tools from microservice commands
+    # Build tools from microservice commands, sorted by name so the rendered
+    # tools section of the prompt is byte-stable across constructions
+    # (identical prefixes hit the provider's automatic prompt cache)
     if use_sciborg_tools:
         tools = [
             LinqxTool(sciborg_command=command, handle_tool_error=handle_tool_error) 
-            for command in microservice.commands.values()
+            for _, command in sorted(microservice.commands.items())
         ]
     else:
         tools = [
             command_to_tool(command) 
-            for command in microservice.commands.values()
+            for _, command in sorted(microservice.commands.items())
         ]
 
     action_tool_names = [x.name for x in tools]
@@ -346,12 +353,14 @@ def create_sciborg_chat_agent(
     # Create agent from prompt and tools
     agent = create_structured_chat_agent(llm=llm, tools=tools, prompt=prompt)
     
-    return AgentExecutor(
+    return ParallelToolsAgentExecutor(
         agent=agent,
         tools=tools,
         memory=memory,
         verbose=verbose,
         handle_parsing_errors=True,
         return_intermediate_steps=return_intermediate_steps,
+        parallel_tool_execution=parallel_tool_execution,
+        max_parallel_tools=max_parallel_tools,
         **agent_executor_kwargs
     )
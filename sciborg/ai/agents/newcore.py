@@ -16,6 +16,7 @@ and managing AI agents that operate microservices.
 
 import json
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Any, Literal, Type, Optional
 from inspect import signature, getdoc
 from pydantic import BaseModel
@@ -62,11 +63,79 @@ from sciborg.ai.prompts.memory import ACTION_LOG_FSA_TEMPLATE
 
 
 
-class SciborgAgentExecutor(AgentExecutor):
+# Default cap on concurrently running tool calls
+TOOL_CONCURRENCY_LIMIT = 5
+
+
+class ParallelToolsAgentExecutor(AgentExecutor):
+    """
+    AgentExecutor that dispatches parallel tool calls concurrently.
+
+    When the LLM returns several independent AgentActions in one step
+    (OpenAI parallel function calling), the tool runs are I/O-bound (PubChem
+    HTTP calls, RAG retrieval), so fanning them out on threads turns
+    N x latency into roughly max latency. Set parallel_tool_execution=False
+    to restore strictly serial execution.
+    """
+
+    parallel_tool_execution: bool = True
+    max_parallel_tools: int = TOOL_CONCURRENCY_LIMIT
+
+    def _take_next_step(
+        self,
+        name_to_tool_map,
+        color_mapping,
+        inputs,
+        intermediate_steps,
+        run_manager=None,
+    ):
+        if not self.parallel_tool_execution:
+            return super()._take_next_step(
+                name_to_tool_map, color_mapping, inputs, intermediate_steps, run_manager
+            )
+
+        try:
+            prepared_steps = self._prepare_intermediate_steps(intermediate_steps)
+            output = self._action_agent.plan(
+                prepared_steps,
+                callbacks=run_manager.get_child() if run_manager else None,
+                **inputs,
+            )
+        except Exception:
+            # Parsing/validation failures have recovery logic (e.g.
+            # handle_parsing_errors) in the upstream serial path - re-plan
+            # through it rather than duplicating that handling here
+            return super()._take_next_step(
+                name_to_tool_map, color_mapping, inputs, intermediate_steps, run_manager
+            )
+
+        if isinstance(output, AgentFinish):
+            return output
+        actions = [output] if isinstance(output, AgentAction) else list(output)
+
+        if len(actions) <= 1:
+            return self._consume_next_step([
+                self._perform_agent_action(name_to_tool_map, color_mapping, action, run_manager)
+                for action in actions
+            ])
+
+        # pool.map preserves input order, so observations line up with the
+        # actions the agent emitted
+        with ThreadPoolExecutor(max_workers=min(self.max_parallel_tools, len(actions))) as pool:
+            steps = list(pool.map(
+                lambda action: self._perform_agent_action(
+                    name_to_tool_map, color_mapping, action, run_manager
+                ),
+                actions,
+            ))
+        return self._consume_next_step(steps)
+
+
+class SciborgAgentExecutor(ParallelToolsAgentExecutor):
     """
     Custom AgentExecutor with FSA (Finite State Automaton) support.
-    
-    Extends the base AgentExecutor to provide:
+
+    Extends ParallelToolsAgentExecutor to provide:
     - FSA state management
     - Custom action hooks for state updates
     - Node highlighting based on state checks
@@ -378,16 +447,17 @@ class SciborgAgent:
         """
         tools = []
         
-        # Add microservice commands as tools
+        # Add microservice commands as tools, sorted by name so the rendered
+        # tools section of the prompt is byte-stable across constructions
         if use_sciborg_tools:
             tools = [
                 LinqxTool(sciborg_command=command, handle_tool_error=handle_tool_error) 
-                for command in self.microservice.commands.values()
+                for _, command in sorted(self.microservice.commands.items())
             ]
         else:
             tools = [
                 self._command_to_tool(command) 
-                for command in self.microservice.commands.values()
+                for _, command in sorted(self.microservice.commands.items())
             ]
         
         # Add human interaction tool if enabled
@@ -814,3 +884,42 @@ class SciborgAgent:
             "Consider using alternative visualization methods or re-implementing without stateflow."
         )
 
+
+def invoke_agents_concurrently(
+    invocations: list[tuple[str, Any]],
+    max_workers: int | None = None
+) -> dict[str, Any]:
+    """
+    Run independent agent invocations concurrently and collect their results.
+
+    Agent calls are dominated by LLM HTTP latency, so overlapping them on
+    threads cuts total wall time to roughly the slowest call instead of the
+    sum. Only use this for agents that do not share memory or FSA state.
+
+    Example:
+        ```python
+        results = invoke_agents_concurrently([
+            ("pubchem", lambda: pubchem.invoke({"question": q1})),
+            ("rag", lambda: rag.invoke({"question": q2})),
+        ])
+        ```
+
+    Args:
+        invocations: List of (name, zero-argument callable) pairs, each
+            callable performing one agent invocation
+        max_workers: Thread cap (defaults to one thread per invocation)
+
+    Returns:
+        Dict mapping each name to its result, or to the exception it raised
+    """
+    results: dict[str, Any] = {}
+    with ThreadPoolExecutor(max_workers=max_workers or len(invocations)) as pool:
+        futures = {pool.submit(fn): name for name, fn in invocations}
+        for future in as_completed(futures):
+            name = futures[future]
+            try:
+                results[name] = future.result()
+            except Exception as e:
+                results[name] = e
+    return results
+
@@ -17,27 +17,32 @@ from langchain_core.language_models import BaseLanguageModel
 
 def rag_agent(
     question: str,
-    path_to_embeddings: str,
-    llm: BaseLanguageModel | None = None
+    path_to_embeddings: str | None = None,
+    llm: BaseLanguageModel | None = None,
+    vectorstore=None
 ) -> AgentExecutor:
     """
     Create a RAG (Retrieval Augmented Generation) agent.
-    
+
     This agent can answer questions by retrieving relevant information from a vector
     database of documents. It provides answers with citations (title and page numbers).
-    
+
     Args:
         question: The question to answer (used for initialization)
         path_to_embeddings: Path to the FAISS vector database directory
         llm: Language model to use (defaults to GPT-4 with temperature=0.1)
-        
+        vectorstore: Pre-loaded vector store. When provided, the FAISS load
+            from path_to_embeddings is skipped entirely - use this to share
+            one deserialized index across several agents
+
     Returns:
         AgentExecutor: Configured agent ready to answer questions using RAG
-        
+
     Note:
         Currently assumes FAISS vector store. The embeddings are loaded using
-        OpenAIEmbeddings. To use a different vector store, modify this function.
-        
+        OpenAIEmbeddings. To use a different vector store, pass it in via
+        `vectorstore`.
+
     Example:
         ```python
         agent = rag_agent("What is the procedure?", "/path/to/embeddings")
@@ -46,14 +51,19 @@ def rag_agent(
     """
     if llm is None:
         llm = ChatOpenAI(temperature=0.1)
-    
-    embeddings = OpenAIEmbeddings()
-    db = FAISS.load_local(
-        path_to_embeddings, 
-        embeddings, 
-        allow_dangerous_deserialization=True
-    )
-    retriever = db.as_retriever()
+
+    if vectorstore is None:
+        if path_to_embeddings is None:
+            raise ValueError(
+                "rag_agent requires either path_to_embeddings or a pre-loaded vectorstore"
+            )
+        embeddings = OpenAIEmbeddings()
+        vectorstore = FAISS.load_local(
+            path_to_embeddings,
+            embeddings,
+            allow_dangerous_deserialization=True
+        )
+    retriever = vectorstore.as_retriever()
 
     @tool
     def get_answer_from_information(situation: str) -> str:
@@ -2,17 +2,14 @@
 Uses Langchains built-in JSON parsing to build SCIBORG objects in a highly structure manner
 '''
 from typing import Any, Dict, Type, List
+import json
 
-from langchain_classic.chains import LLMChain
 from langchain_core.prompts import PromptTemplate
-from pydantic import BaseModel as BaseModelV2, Field
-from langchain_classic.memory import ConversationBufferWindowMemory
+from pydantic import BaseModel as BaseModelV2, Field, ValidationError
 
 from langchain_core.output_parsers import JsonOutputParser
 from langchain_core.language_models import BaseLanguageModel
-from langchain_core.runnables import Runnable, RunnableConfig, chain, RunnableSequence
-
-from langchain_classic.base_memory import BaseMemory
+from langchain_core.runnables import Runnable, RunnableSequence
 
 from langchain_openai import ChatOpenAI
 
@@ -20,100 +17,87 @@ from sciborg.ai.schema.parameter import ParameterSchemaV1
 from sciborg.ai.schema.command import LibraryCommandSchemaV1
 from sciborg.ai.schema.workflow import RunWorkflowSchemaV1
 
-class LinqxLLMChain(LLMChain):
+# Template suffixes appended to the base prompt on chain reinvocation
+PAST_RESPONSE_TEMPLATE_SUFFIX = """\nThe previous output you generated to the question was the following:\n{past_response}."""
+ERROR_TEMPLATE_SUFFIX = """\nThe previous output generated an error.
+please fix this error in your response.\nError:\n{error}"""
+
+def build_linqx_runnable(
+    llm: BaseLanguageModel,
+    sciborg_object: Type[BaseModelV2],
+    template: str = 'Answer the users query.\n{query}',
+    with_retry_context: bool = False
+) -> Runnable:
     '''
-    Custom LLM chain for SCIBORG object utility.
-
-    This object will operate as a standard Langchain LLM chain but uses Langchain's built-in JSON parser to
-    format output in compliance with SCIBORG object format.
+    Builds a raw `prompt | llm | parser` Runnable for SCIBORG object construction.
 
-    To build an object invoke the LLM chain with a specific query
+    This replaces the legacy LinqxLLMChain (an LLMChain subclass): a bare
+    Runnable skips LLMChain's per-call callback dispatch, prep_inputs/prep_outputs,
+    memory hooks, and dict I/O wrapping.
 
     ```python
-    # Construct the LLM chain
-    chain = LinqxLLMChain(
-        llm=llm,
-        sciborg_object=LinqxObjectClass
-    )
+    # Construct the runnable
+    runnable = build_linqx_runnable(llm=llm, sciborg_object=LinqxObjectClass)
 
-    # Run the chain against a query
-    output = chain.invoke(input={'query': 'Some information about the object you would like to build...'})
+    # Run it against a query
+    sciborg_object_dictionary = runnable.invoke({'query': 'Some information about the object...'})
 
-    # Get the output and build the object from the mapping
-    sciborg_object_dictionary = output['text']
+    # Build the object from the mapping
     sciborg_object = LinqxObjectClass(**sciborg_object_dictionary)
     ```
 
-    If the LLM is not able to get a correct version of the object after the first iteration, you can recall the chain with
-    the output and error message to attempt to fix the issue
-
-    ```python
-    try:
-        sciborg_object_dictionary = output['text'] 
-        sciborg_object = LinqxObjectClass(**sciborg_object_dictionary)
-    except Exception as e:
-        new_output = chain.invoke(
-            input = {
-                'query': 'Some information about the object you would like to build...'},
-                'past_response': json.dumps(sciborg_object_dictionary),
-                'error' = str(e)
-            }
-        )
-    ```
+    If `with_retry_context` is True, the prompt additionally expects
+    `past_response` and `error` input variables for fix-up reinvocation
+    (see `invoke_linqx_runnable` for the full retry loop).
     '''
-    sciborg_object: Type[BaseModelV2]
-    prompt: PromptTemplate = PromptTemplate(
-        template='Answer the users query.\n{query}',
-        input_variables=['query']
+    parser = JsonOutputParser(pydantic_object=sciborg_object)
+
+    template_parts = [template, "\n{format_instructions}"]
+    input_variables = ('query',)
+    if with_retry_context:
+        template_parts.append(PAST_RESPONSE_TEMPLATE_SUFFIX)
+        template_parts.append(ERROR_TEMPLATE_SUFFIX)
+        input_variables = (*input_variables, 'past_response', 'error')
+
+    prompt = PromptTemplate(
+        template=''.join(template_parts),
+        input_variables=input_variables,
+        partial_variables={'format_instructions': parser.get_format_instructions()}
     )
 
-    def model_post_init(self) -> None:
-        '''
-        Initialize output parser and update prompt with format instructions.
-        Uses Pydantic v2 model_post_init hook.
-        '''
-        # Assign output parser
-        self.output_parser = JsonOutputParser(pydantic_object=self.sciborg_object)
-
-        # Create new set of partial varaibles
-        new_partial_varaibles = self.prompt.partial_variables
-        new_partial_varaibles['format_instructions'] = self.output_parser.get_format_instructions()
-
-        # Create new prompt
-        self.prompt = PromptTemplate(
-            template=self.prompt.template+"\n{format_instructions}",
-            input_variables=self.prompt.input_variables,
-            partial_variables=new_partial_varaibles
-        )
-
-    def invoke(
-        self,
-        input: Dict[str, Any],
-        config: RunnableConfig | None = None,
-        **kwargs: Any
-    ) -> Dict[str, Any]:
-        # We are reinvoking with the past response, restructure the prompt for this
-        if 'past_response' in input.keys() and 'past_response' not in self.prompt.input_variables:
-            new_input_vars = [var for var in self.prompt.input_variables]
-            new_input_vars.append('past_response')
-            self.prompt = PromptTemplate(
-                template=self.prompt.template+"""\nThe previous output you generated to the question was the following:\n{past_response}.""",
-                input_variables=new_input_vars,
-                partial_variables=self.prompt.partial_variables
-            )
-        # If we are reinvoking with an error, restructure the prompt for this
-        if 'error' in input.keys() and 'error' not in self.prompt.input_variables:
-            new_input_vars = [var for var in self.prompt.input_variables]
-            new_input_vars.append('error')
-            self.prompt = PromptTemplate(
-                template=self.prompt.template+"""\nThe previous output generated an error. 
-                please fix this error in your response.\nError:\n{error}""",
-                input_variables=new_input_vars,
-                partial_variables=self.prompt.partial_variables
-            )
-        
-        # Return LLM chain invoke
-        return super().invoke(input, config, **kwargs)
+    return prompt | llm | parser
+
+def invoke_linqx_runnable(
+    llm: BaseLanguageModel,
+    sciborg_object: Type[BaseModelV2],
+    query: str,
+    retries: int = 1,
+    template: str = 'Answer the users query.\n{query}'
+) -> BaseModelV2:
+    '''
+    Invokes a linqx runnable against the query and builds the SCIBORG object
+    from its output. On validation failure, reinvokes with the past response
+    and error message (up to `retries` times) using a pre-built retry-prompt
+    variant before re-raising.
+    '''
+    runnable = build_linqx_runnable(llm, sciborg_object, template)
+    output = runnable.invoke({'query': query})
+
+    retry_runnable = None
+    for _ in range(retries):
+        try:
+            return sciborg_object.model_validate(output)
+        except ValidationError as e:
+            # Build the retry variant once, on first failure
+            if retry_runnable is None:
+                retry_runnable = build_linqx_runnable(llm, sciborg_object, template, with_retry_context=True)
+            output = retry_runnable.invoke({
+                'query': query,
+                'past_response': json.dumps(output),
+                'error': str(e)
+            })
+
+    return sciborg_object.model_validate(output)
 
 def create_json_parser(
     pydantic_object: BaseModelV2, 
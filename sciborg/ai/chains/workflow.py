@@ -1,6 +1,8 @@
 '''
 Custom LLM chains for workflow construction
 '''
+import weakref
+
 from langchain_core.prompts import PromptTemplate
 
 from pydantic import BaseModel as BaseModelV2
@@ -10,7 +12,12 @@ from langchain_core.language_models import BaseLanguageModel
 
 from langchain_openai import ChatOpenAI
 
-from typing import Type
+from typing import Dict, Tuple, Type
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from sciborg.core.library.base import BaseCommandLibrary
 
@@ -20,6 +27,63 @@ from sciborg.ai.prompts.workflow import (
     BASE_WORKFLOW_PLANNING_PROMPT,
 )
 
+# Serialized command libraries keyed by object id. Libraries are typically
+# built once and reused, so the (large) JSON dump is only computed on change.
+# Entries are evicted via weakref.finalize when the library is collected -
+# without that, a new library allocated at a recycled address would silently
+# be served the dead library's JSON.
+_serialized_library_cache: Dict[int, str] = {}
+
+# Partial-bound prompt templates keyed by (template, serialized library)
+_library_prompt_cache: Dict[Tuple[str, int], PromptTemplate] = {}
+
+def set_command_library(library: BaseCommandLibrary) -> str:
+    '''
+    Serializes the command library and caches the result for reuse across chain
+    construction. Call again after mutating a library to refresh the cache.
+    '''
+    # orjson serializes the dumped dict faster than pydantic's indented
+    # encoder on large libraries; output is equivalent 2-space-indented JSON
+    if orjson is not None:
+        serialized = orjson.dumps(library.model_dump(), option=orjson.OPT_INDENT_2).decode()
+    else:
+        serialized = library.model_dump_json(indent=2)
+    key = id(library)
+    if key not in _serialized_library_cache:
+        # Drop the entry when the library dies so a later library reusing
+        # the same address can never hit the stale serialization
+        weakref.finalize(library, _serialized_library_cache.pop, key, None)
+    _serialized_library_cache[key] = serialized
+    return serialized
+
+def _serialize_command_library(library: BaseCommandLibrary) -> str:
+    '''
+    Gets the cached serialization of the command library, computing it if needed.
+    '''
+    serialized = _serialized_library_cache.get(id(library))
+    if serialized is None:
+        serialized = set_command_library(library)
+    return serialized
+
+def _get_library_prompt(prompt: str, command_library: str) -> PromptTemplate:
+    '''
+    Gets (building and caching if needed) a prompt template with the serialized
+    command library bound as a partial variable, so the heavy library text never
+    re-flows through template construction for an unchanged library.
+    '''
+    cache_key = (prompt, hash(command_library))
+    prompt_template = _library_prompt_cache.get(cache_key)
+    if prompt_template is None:
+        prompt_template = PromptTemplate(
+            template=prompt,
+            input_variables=['query'],
+            partial_variables={
+                'command_library': command_library
+            }
+        )
+        _library_prompt_cache[cache_key] = prompt_template
+    return prompt_template
+
 def create_workflow_planner_chain(
     library: BaseCommandLibrary,
     llm: BaseLanguageModel | None = None,
@@ -29,20 +93,14 @@ def create_workflow_planner_chain(
     Creates an LLM chain for workflow planning based on the provided command library.
 
     This chain can serve as an intermediary between higher level planning and operational planning.
-    
+
     Returns a RunnableSequence (LCEL chain) instead of LLMChain for LangChain v1.0+ compatibility.
     '''
     if llm is None:
         llm = ChatOpenAI(temperature=0.1)
-    
-    # Define prompt template
-    prompt_template = PromptTemplate(
-        template=prompt,
-        input_variables=['query'],
-        partial_variables={
-            'command_library': library.model_dump_json(indent=2)
-        }
-    )
+
+    # Define prompt template with the cached library serialization partial-bound
+    prompt_template = _get_library_prompt(prompt, _serialize_command_library(library))
 
     # Return LCEL chain (prompt | llm)
     return prompt_template | llm
@@ -64,12 +122,12 @@ def create_workflow_constructor_chain(
     # Define output parser
     output_parser = JsonOutputParser(pydantic_object=output_schema)
 
-    # Define prompt template
+    # Define prompt template, reusing the cached library serialization
     prompt_template = PromptTemplate(
         template=prompt,
         input_variables=['query'],
         partial_variables={
-            "command_library": library.model_dump_json(indent=2),
+            "command_library": _serialize_command_library(library),
             "format_instructions": output_parser.get_format_instructions(),
             }
     )
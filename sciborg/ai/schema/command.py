@@ -1,5 +1,5 @@
 # from langchain.pydantic_v1 import BaseModel, root_validator, Field
-from pydantic import BaseModel as BaseModelV2, Field, field_validator
+from pydantic import BaseModel as BaseModelV2, Field, TypeAdapter, field_validator
 from typing import Dict, Type, Any, Union
 import json
 from uuid import UUID
@@ -10,6 +10,16 @@ from sciborg.ai.schema.parameter import(
 )
 from sciborg.core.command.base import BaseInfoCommand
 
+def _normalize_parameters(v):
+    """Normalize None to empty dict for parameters.
+
+    Shared by all command schemas so pydantic registers a single validator
+    function instead of one bound classmethod per class.
+    """
+    if v is None:
+        return {}
+    return v
+
 class LibraryCommandSchemaV1(BaseModelV2):
 
     # Command Model attributes
@@ -17,39 +27,44 @@ class LibraryCommandSchemaV1(BaseModelV2):
     microservice: str
     desc: str = Field('A short description of the command')
     uuid: UUID
-    parameters: Dict[str, ParameterModelSchemaV1] | None = Field(default={})
-    
-    @field_validator('parameters', mode='before')
-    @classmethod
-    def normalize_parameters(cls, v):
-        """Normalize None to empty dict for parameters."""
-        if v is None:
-            return {}
-        return v
+    parameters: Dict[str, ParameterModelSchemaV1] = Field(default_factory=dict)
+
+    normalize_parameters = field_validator('parameters', mode='before')(_normalize_parameters)
     # Library command attributes
+    # Note: non-optional dict (with None normalized before validation) avoids
+    # pydantic's nullable-schema wrapper on the validation hot path
     has_return: bool = False
-    return_signature: Dict[str, str] | None = Field(
-        default={},
+    return_signature: Dict[str, str] = Field(
+        default_factory=dict,
         description="""
         A return signature in JSON format of the command
         Key - name of the return varaible
         Value - description of the return varaible
         """
     )
+
+    normalize_return_signature = field_validator('return_signature', mode='before')(_normalize_parameters)
     
 class BaseRunCommandSchemaV1(BaseModelV2):
     name: str
     microservice: str
     uuid: UUID
     # desc: str = ""
-    parameters: Dict[str, ParameterSchemaV1] | None = Field(default={})
-    
-    @field_validator('parameters', mode='before')
-    @classmethod
-    def normalize_parameters(cls, v):
-        """Normalize None to empty dict for parameters."""
-        if v is None:
-            return {}
-        return v
-    
-    save_vars: Dict[str, str] = {}
\ No newline at end of file
+    parameters: Dict[str, ParameterSchemaV1] = Field(default_factory=dict)
+
+    normalize_parameters = field_validator('parameters', mode='before')(_normalize_parameters)
+
+    save_vars: Dict[str, str] = {}
+
+# Pre-instantiated TypeAdapters - validate_python is pydantic v2's fast path,
+# skipping the kwargs-binding layer of Model(**data)
+_library_command_adapter = TypeAdapter(LibraryCommandSchemaV1)
+_run_command_adapter = TypeAdapter(BaseRunCommandSchemaV1)
+
+def validate_command(obj: Any) -> LibraryCommandSchemaV1:
+    """Validate an object against LibraryCommandSchemaV1 via the cached adapter."""
+    return _library_command_adapter.validate_python(obj)
+
+def validate_run_command(obj: Any) -> BaseRunCommandSchemaV1:
+    """Validate an object against BaseRunCommandSchemaV1 via the cached adapter."""
+    return _run_command_adapter.validate_python(obj)
\ No newline at end of file
@@ -1,5 +1,5 @@
 # from langchain.pydantic_v1 import BaseModel, root_validator
-from pydantic import BaseModel as BaseModelV2
+from pydantic import BaseModel as BaseModelV2, TypeAdapter
 from typing import List, Any, Dict
 
 from sciborg.core.workflow.base import BaseInfoWorkflow
@@ -7,4 +7,13 @@ from sciborg.ai.schema.command import BaseRunCommandSchemaV1
 
 class RunWorkflowSchemaV1(BaseModelV2):
     name: str
-    commands: List[BaseRunCommandSchemaV1]
\ No newline at end of file
+    commands: List[BaseRunCommandSchemaV1]
+
+# Pre-instantiated TypeAdapter - callers that validate parsed workflow
+# JSON should go through this instead of RunWorkflowSchemaV1(**data) so the
+# schema is traversed once at import rather than per validation
+_run_workflow_adapter = TypeAdapter(RunWorkflowSchemaV1)
+
+def validate_run_workflow(obj: Any) -> RunWorkflowSchemaV1:
+    """Validate an object against RunWorkflowSchemaV1 via the cached adapter."""
+    return _run_workflow_adapter.validate_python(obj)
\ No newline at end of file
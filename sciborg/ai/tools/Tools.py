@@ -27,6 +27,13 @@ from spython.main import Client
 # Builtin Python imports
 import sys, os
 import json
+import functools
+
+# orjson is optional - used for faster JSON serialization when available
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Import SCIBORG infrastructure objects
 from sciborg.core.parameter.base import ParameterModel, ValueType
@@ -72,18 +79,28 @@ def _get_llm_microservice_dir() -> str:
 # Custom functions for SCIBORG interaction
 # Note: Using StructuredTool.from_function instead of @tool decorator
 # to avoid import-time issues with environment variables
+# Note: model_validate(kwargs) skips the keyword-binding machinery of Model(**kwargs)
 def build_parameter_model_func(**kwargs) -> str:
-    return ParameterModel(**kwargs).model_dump_json(indent=2, exclude_defaults=True)
+    return ParameterModel.model_validate(kwargs).model_dump_json(indent=2, exclude_defaults=True)
 
 def build_schedule_template_func(**kwargs) -> str:
     # TODO: BaseScheduleTemplate doesn't exist - needs to be implemented or removed
     # For now, use ScheduleSchemaV1
-    return ScheduleSchemaV1(**kwargs).model_dump_json(indent=2, exclude_defaults=True)
+    return ScheduleSchemaV1.model_validate(kwargs).model_dump_json(indent=2, exclude_defaults=True)
+
+# Agents frequently resend an identical template while iterating with the user,
+# so request building is memoized on the kwargs representation
+_request_template_cache: Dict[str, str] = {}
 
 def build_request_from_template_func(**kwargs) -> str:
     # TODO: BaseScheduleTemplate doesn't exist - needs to be implemented or removed
     # For now, use ScheduleSchemaV1
-    return ScheduleSchemaV1(**kwargs).model_dump_json(indent=2)
+    cache_key = repr(sorted(kwargs.items()))
+    cached = _request_template_cache.get(cache_key)
+    if cached is None:
+        cached = ScheduleSchemaV1.model_validate(kwargs).model_dump_json(indent=2)
+        _request_template_cache[cache_key] = cached
+    return cached
 
 # Custom functions for Spython interaction
 def get_apptainer_microservice_tags(filename: str) -> str:
@@ -153,105 +170,140 @@ def get_all_help(**kwargs) -> str:
 # Define custom SCIBORG infrastructure tools
 # Note: build_parameter_model_func uses ParameterModel, not ParameterModelSchemaV1
 # The schema should match what ParameterModel expects
-parameter_init_tool = StructuredTool.from_function(
-    args_schema=ParameterModelSchemaV1,
-    func=build_parameter_model_func,
-    name='Build Parameter',
-    description='''
-        Builds a parameter model.
-        The data types of upper_limit, lower_limit, and allowed_values must match the parameter data type.
-        For example, if the data type is a float, they must be passed in as floats not integers. 
-        Precision is only required if data_type is a float. It should be an integer greater than 0.
-        If upper and lower limits are provided, upper limit must be greater than or equal to the lower limit.
-    '''
-)
-
-schedule_template_init_tool = StructuredTool.from_function(
-    args_schema=ScheduleSchemaV1,
-    func=build_schedule_template_func,
-    name='Build Schedule Template',
-    description='''
-        Builds a schedule template.
-        The argument schema for this tool is recursively defined. If a python dictionary is passed in as 
-        a value to the template dictionary, it must be in the same format as the provided argument schema.
-    '''
-)
-
-build_request_from_template_tool = StructuredTool.from_function(
-    args_schema=ScheduleSchemaV1,
-    func=build_request_from_template_func,
-    name='Build Request from Template',
-    description='''
-        Converts a valid schedule template to a request.
-        The input to this tool should be a valid schedule template output by the 'Build Schedule Template' tool.
-        You should always provide the user with the output of this tool and tell them that this is the template which
-        they created.
-    '''
-)
+# Note: Tools are constructed lazily (and cached) because StructuredTool.from_function
+# runs pydantic schema introspection on args_schema, which is expensive at import time.
+# Module-level names (e.g. parameter_init_tool) are preserved via __getattr__ below.
+@functools.cache
+def _parameter_init_tool() -> StructuredTool:
+    return StructuredTool.from_function(
+        args_schema=ParameterModelSchemaV1,
+        func=build_parameter_model_func,
+        name='Build Parameter',
+        description='''
+            Builds a parameter model.
+            The data types of upper_limit, lower_limit, and allowed_values must match the parameter data type.
+            For example, if the data type is a float, they must be passed in as floats not integers.
+            Precision is only required if data_type is a float. It should be an integer greater than 0.
+            If upper and lower limits are provided, upper limit must be greater than or equal to the lower limit.
+        '''
+    )
+
+@functools.cache
+def _schedule_template_init_tool() -> StructuredTool:
+    return StructuredTool.from_function(
+        args_schema=ScheduleSchemaV1,
+        func=build_schedule_template_func,
+        name='Build Schedule Template',
+        description='''
+            Builds a schedule template.
+            The argument schema for this tool is recursively defined. If a python dictionary is passed in as
+            a value to the template dictionary, it must be in the same format as the provided argument schema.
+        '''
+    )
+
+@functools.cache
+def _build_request_from_template_tool() -> StructuredTool:
+    return StructuredTool.from_function(
+        args_schema=ScheduleSchemaV1,
+        func=build_request_from_template_func,
+        name='Build Request from Template',
+        description='''
+            Converts a valid schedule template to a request.
+            The input to this tool should be a valid schedule template output by the 'Build Schedule Template' tool.
+            You should always provide the user with the output of this tool and tell them that this is the template which
+            they created.
+        '''
+    )
 
 # Define custom tools for interacting with containerized microservices
-get_all_microservice_tag_tool = StructuredTool.from_function(
-    func=get_all_tags,
-    name='Get_All_Microservice_Tags',
-    description='''
-        Gets tags for all available microservices.
-        The output from this tool will be a JSON formatted string which contains "filename": "list of tags"
-    '''
-)
-
-get_all_microservice_help_tool = StructuredTool.from_function(
-    func=get_all_help,
-    name='Get_All_Microservice_Help',
-    description='''
-        Gets the helpfile information for all available microservices.
-        The output from this tool will be a JSON formatted string which contains "filename": "helpfile information"
-    '''
-)
-
-get_microservice_all_app_help_tool = StructuredTool.from_function(
-    # args_schema=ApptainerFilenameAppTemplateV1,  # TODO: Schema doesn't exist
-    func=get_all_app_help,
-    name='Get_Microservice_All_App_Help',
-    description='''
-        Gets the help information for all applications of the provided microservice file.
-        The input to this tool should be a dictionary of a single .sif filename for which you want to get information on the apps.
-        The output from this tool will be a JSON formatted string which contains "app name": "help information"
-    '''
-)
-
-get_microservice_all_app_help_from_files_tools = StructuredTool.from_function(
-    # args_schema=ApptainerFilenameListTemplateV1,  # TODO: Schema doesn't exist
-    func=get_all_app_help_from_files,
-    name='Get_Microservice_All_App_Help_From_Files',
-    description='''
-        Gets the help information for all applications of the provided microservice .sif files.
-        The input to this tool should be a dictionary of a a list of .sif filenames you want to get information on the apps.
-        The output from this tool will be a JSON formatted string which contains "filename": "app name": "help information", "input information", "output information"
-    '''
-)
-
-get_microservice_help_from_filenames_tool = StructuredTool.from_function(
-    # args_schema=ApptainerFilenameListTemplateV1,  # TODO: Schema doesn't exist
-    func=get_help_from_filenames,
-    name='Get_Microservice_Help_From_File_List',
-    description='''
-        Gets the helpfile information for the provided files.
-        The input to this tool should be a dictionary of a list of .sif filenames you want to get the tags of.
-        The output from this tool will be a JSON formatted string which contains "filename": "list of tags"
-    '''
-)
-
-get_microservice_tags_from_filenames_tool = StructuredTool.from_function(
-    # args_schema=ApptainerFilenameListTemplateV1,  # TODO: Schema doesn't exist
-    func=get_tags_from_filenames,
-    name='Get_Microservice_Tags_From_File_List',
-    description='''
-        Gets the tag information for the provided files.
-        The input to this tool should be a list of .sif filenames you want to get the tags of.
-        You must provide a filename that was observed from the output of the 'Get_All_Microservice_Tags' tool.
-        The output from this tool will be a JSON formatted string which contains "filename": "list of tags"
-    '''
-)
+@functools.cache
+def _get_all_microservice_tag_tool() -> StructuredTool:
+    return StructuredTool.from_function(
+        func=get_all_tags,
+        name='Get_All_Microservice_Tags',
+        description='''
+            Gets tags for all available microservices.
+            The output from this tool will be a JSON formatted string which contains "filename": "list of tags"
+        '''
+    )
+
+@functools.cache
+def _get_all_microservice_help_tool() -> StructuredTool:
+    return StructuredTool.from_function(
+        func=get_all_help,
+        name='Get_All_Microservice_Help',
+        description='''
+            Gets the helpfile information for all available microservices.
+            The output from this tool will be a JSON formatted string which contains "filename": "helpfile information"
+        '''
+    )
+
+@functools.cache
+def _get_microservice_all_app_help_tool() -> StructuredTool:
+    return StructuredTool.from_function(
+        # args_schema=ApptainerFilenameAppTemplateV1,  # TODO: Schema doesn't exist
+        func=get_all_app_help,
+        name='Get_Microservice_All_App_Help',
+        description='''
+            Gets the help information for all applications of the provided microservice file.
+            The input to this tool should be a dictionary of a single .sif filename for which you want to get information on the apps.
+            The output from this tool will be a JSON formatted string which contains "app name": "help information"
+        '''
+    )
+
+@functools.cache
+def _get_microservice_all_app_help_from_files_tools() -> StructuredTool:
+    return StructuredTool.from_function(
+        # args_schema=ApptainerFilenameListTemplateV1,  # TODO: Schema doesn't exist
+        func=get_all_app_help_from_files,
+        name='Get_Microservice_All_App_Help_From_Files',
+        description='''
+            Gets the help information for all applications of the provided microservice .sif files.
+            The input to this tool should be a dictionary of a a list of .sif filenames you want to get information on the apps.
+            The output from this tool will be a JSON formatted string which contains "filename": "app name": "help information", "input information", "output information"
+        '''
+    )
+
+@functools.cache
+def _get_microservice_help_from_filenames_tool() -> StructuredTool:
+    return StructuredTool.from_function(
+        # args_schema=ApptainerFilenameListTemplateV1,  # TODO: Schema doesn't exist
+        func=get_help_from_filenames,
+        name='Get_Microservice_Help_From_File_List',
+        description='''
+            Gets the helpfile information for the provided files.
+            The input to this tool should be a dictionary of a list of .sif filenames you want to get the tags of.
+            The output from this tool will be a JSON formatted string which contains "filename": "list of tags"
+        '''
+    )
+
+@functools.cache
+def _get_microservice_tags_from_filenames_tool() -> StructuredTool:
+    return StructuredTool.from_function(
+        # args_schema=ApptainerFilenameListTemplateV1,  # TODO: Schema doesn't exist
+        func=get_tags_from_filenames,
+        name='Get_Microservice_Tags_From_File_List',
+        description='''
+            Gets the tag information for the provided files.
+            The input to this tool should be a list of .sif filenames you want to get the tags of.
+            You must provide a filename that was observed from the output of the 'Get_All_Microservice_Tags' tool.
+            The output from this tool will be a JSON formatted string which contains "filename": "list of tags"
+        '''
+    )
+
+# Lazy getters for each module-level tool name (PEP 562 __getattr__ at the bottom
+# of this module resolves e.g. `from Tools import parameter_init_tool` through these)
+_LAZY_TOOL_GETTERS = {
+    'parameter_init_tool': _parameter_init_tool,
+    'schedule_template_init_tool': _schedule_template_init_tool,
+    'build_request_from_template_tool': _build_request_from_template_tool,
+    'get_all_microservice_tag_tool': _get_all_microservice_tag_tool,
+    'get_all_microservice_help_tool': _get_all_microservice_help_tool,
+    'get_microservice_all_app_help_tool': _get_microservice_all_app_help_tool,
+    'get_microservice_all_app_help_from_files_tools': _get_microservice_all_app_help_from_files_tools,
+    'get_microservice_help_from_filenames_tool': _get_microservice_help_from_filenames_tool,
+    'get_microservice_tags_from_filenames_tool': _get_microservice_tags_from_filenames_tool,
+}
 
 ###############################################################
 # Custom Tools
@@ -273,7 +325,10 @@ class JSONWriteFileTool(WriteFileTool):
             run_manager: CallbackManagerForToolRun | None = None
     ) -> str:
         if isinstance(text, dict):
-            text = json.dumps(text, indent=2)
+            if orjson is not None:
+                text = orjson.dumps(text, option=orjson.OPT_INDENT_2).decode()
+            else:
+                text = json.dumps(text, indent=2)
         return super()._run(file_path, text, append, run_manager)
 
 # Define human tool
@@ -336,8 +391,8 @@ def _get_template_builder_tools():
     if write_file_tool is None:
         write_file_tool = _get_write_file_tool()
     return [
-        parameter_init_tool,
-        schedule_template_init_tool,
+        _parameter_init_tool(),
+        _schedule_template_init_tool(),
         human_tool,
         write_file_tool
     ]
@@ -346,18 +401,10 @@ def get_template_builder_tools():
     """Get template builder tools."""
     return _get_template_builder_tools()
 
-def get_template_builder_tool_names():
-    """Get template builder tool names."""
-    return [tool.name for tool in _get_template_builder_tools()]
-
-# For backward compatibility, try to create as lists (will fail if env vars not set)
-try:
-    template_builder_tools = _get_template_builder_tools()
-    template_builder_tool_names = [tool.name for tool in template_builder_tools]
-except (EnvironmentError, NotADirectoryError):
-    # If env vars not set, these will be None and should be accessed via getter functions
-    template_builder_tools = None
-    template_builder_tool_names = None
+@functools.cache
+def get_template_builder_tool_names() -> tuple:
+    """Get template builder tool names as a cached (immutable) tuple."""
+    return tuple(tool.name for tool in _get_template_builder_tools())
 
 # Request Builder Toolkit
 '''
@@ -377,36 +424,29 @@ def _get_request_builder_tools():
         human_tool,
         list_dir_tool,
         read_file_tool,
-        build_request_from_template_tool
+        _build_request_from_template_tool()
     ]
 
 def get_request_builder_tools():
     """Get request builder tools."""
     return _get_request_builder_tools()
 
-def get_request_builder_tool_names():
-    """Get request builder tool names."""
-    return [tool.name for tool in _get_request_builder_tools()]
-
-# For backward compatibility, try to create as lists (will fail if env vars not set)
-try:
-    request_builder_tools = _get_request_builder_tools()
-    request_builder_tool_names = [tool.name for tool in request_builder_tools]
-except (EnvironmentError, NotADirectoryError):
-    # If env vars not set, these will be None and should be accessed via getter functions
-    request_builder_tools = None
-    request_builder_tool_names = None
+@functools.cache
+def get_request_builder_tool_names() -> tuple:
+    """Get request builder tool names as a cached (immutable) tuple."""
+    return tuple(tool.name for tool in _get_request_builder_tools())
 
 # Microservice Selector Toolkit
 '''
  - Tool for getting tags for all microservices in the microservice directory
  - Tool for getting help information of all microservices
 '''
-microservice_selector_tools = [
-    get_all_microservice_tag_tool,
-    get_microservice_help_from_filenames_tool
-]
-microservice_selector_tool_names = [tool.name for tool in microservice_selector_tools]
+def _get_microservice_selector_tools():
+    """Get microservice selector tools."""
+    return [
+        _get_all_microservice_tag_tool(),
+        _get_microservice_help_from_filenames_tool()
+    ]
 
 #App Selector Toolkit
 '''
@@ -414,9 +454,65 @@ microservice_selector_tool_names = [tool.name for tool in microservice_selector_
  - Tool for getting help information of all microservices.
  - Tool for getting information on the app endpoints of a given microservice.
 '''
-app_selector_tools = [
-    get_all_microservice_tag_tool,
-    get_microservice_help_from_filenames_tool,
-    get_microservice_all_app_help_from_files_tools
-]
-app_selector_tool_names = [tool.name for tool in app_selector_tools]
\ No newline at end of file
+def _get_app_selector_tools():
+    """Get app selector tools."""
+    return [
+        _get_all_microservice_tag_tool(),
+        _get_microservice_help_from_filenames_tool(),
+        _get_microservice_all_app_help_from_files_tools()
+    ]
+
+def _build_toolkit(tools: List[BaseTool]) -> tuple:
+    """Pair a toolkit with its name tuple in a single pass."""
+    return tools, tuple(tool.name for tool in tools)
+
+@functools.cache
+def _microservice_selector_toolkit() -> tuple:
+    return _build_toolkit(_get_microservice_selector_tools())
+
+@functools.cache
+def _app_selector_toolkit() -> tuple:
+    return _build_toolkit(_get_app_selector_tools())
+
+def _get_toolkit_attr(name: str):
+    """
+    Build the toolkit lists/names which were previously assigned at import time.
+
+    The template/request builder toolkits require environment variables, so
+    (for backward compatibility) they resolve to None when the env vars are unset.
+    """
+    if name in ('template_builder_tools', 'template_builder_tool_names'):
+        try:
+            tools, tool_names = _build_toolkit(_get_template_builder_tools())
+        except (EnvironmentError, NotADirectoryError):
+            return None
+    elif name in ('request_builder_tools', 'request_builder_tool_names'):
+        try:
+            tools, tool_names = _build_toolkit(_get_request_builder_tools())
+        except (EnvironmentError, NotADirectoryError):
+            return None
+    elif name in ('microservice_selector_tools', 'microservice_selector_tool_names'):
+        tools, tool_names = _microservice_selector_toolkit()
+    elif name in ('app_selector_tools', 'app_selector_tool_names'):
+        tools, tool_names = _app_selector_toolkit()
+    if name.endswith('_tool_names'):
+        return tool_names
+    return tools
+
+_LAZY_TOOLKIT_ATTRS = frozenset({
+    'template_builder_tools', 'template_builder_tool_names',
+    'request_builder_tools', 'request_builder_tool_names',
+    'microservice_selector_tools', 'microservice_selector_tool_names',
+    'app_selector_tools', 'app_selector_tool_names',
+})
+
+def __getattr__(name: str):
+    """
+    PEP 562 module-level __getattr__ to preserve backward compatible access
+    to module-level tools/toolkits without paying their construction cost at import.
+    """
+    if name in _LAZY_TOOL_GETTERS:
+        return _LAZY_TOOL_GETTERS[name]()
+    if name in _LAZY_TOOLKIT_ATTRS:
+        return _get_toolkit_attr(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
\ No newline at end of file
@@ -1,5 +1,6 @@
 from typing import Dict, Any, Coroutine, Callable, Tuple, Type, get_type_hints
 from inspect import signature, getdoc, Parameter
+from functools import lru_cache
 from pydantic import ValidationError as ValidationErrorV2, create_model, Field
 import re
 
@@ -9,33 +10,107 @@ from langchain_core.tools import ToolException
 
 from sciborg.core.command.base import BaseDriverCommand
 
+# Precompiled error-sanitization constants - error handling can run in hot
+# retry loops, so skip the per-call re.compile cache lookup
+_URL_PATTERN = re.compile(r'https?://\S+|www\.\S+')
+_PYDANTIC_URL_PHRASE = 'For further information visit'
 
+# Keys that mark a dict as a JSON Schema definition rather than a value -
+# hoisted to module scope so schema detection runs per-kwarg without
+# rebuilding the set
+_SCHEMA_KEYS = frozenset({'type', 'title', 'description', 'properties', 'required'})
+
+
+def _is_schema_dict(value: Any) -> bool:
+    '''
+    Check if a value looks like a JSON Schema definition rather than an actual value.
+    Schema dicts typically have 'type' and optionally 'title' keys.
+    '''
+    return isinstance(value, dict) and 'type' in value and not _SCHEMA_KEYS.isdisjoint(value)
+
+
+def _clean_schema_from_kwargs(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    '''
+    Remove any kwargs that look like JSON Schema definitions.
+    This handles edge cases where schema metadata is passed instead of values.
+    '''
+    # Schema-like dictionaries shouldn't be passed as values
+    return {key: value for key, value in kwargs.items() if not _is_schema_dict(value)}
+
+# Cached introspection wrappers - inspect.signature and get_type_hints are slow
+# and the same command functions are introspected on every tool construction
+_cached_signature = lru_cache(maxsize=None)(signature)
+_cached_getdoc = lru_cache(maxsize=None)(getdoc)
+_cached_type_hints = lru_cache(maxsize=None)(get_type_hints)
+
+
+@lru_cache(maxsize=None)
 def create_args_schema_from_function(func: Callable, model_name: str) -> Type:
     """
     Create a Pydantic model from a function signature.
     This is a custom implementation that avoids issues with langchain's create_schema_from_function.
+
+    Results are cached by (func, model_name): introspection and create_model's
+    core-schema build are expensive, and tools are frequently reconstructed for
+    the same underlying command.
+
+    Fields are read directly from __code__/__defaults__/__annotations__ -
+    create_model accepts raw annotations, so the heavier signature() and
+    get_type_hints() machinery (forward-reference evaluation, generic
+    resolution) is skipped. Callables without __code__ (builtins, partials)
+    fall back to the signature-based path.
+    """
+    code = getattr(func, '__code__', None)
+    if code is None:
+        return _create_args_schema_from_signature(func, model_name)
+
+    annotations = getattr(func, '__annotations__', {})
+    arg_names = code.co_varnames[:code.co_argcount]
+    defaults = func.__defaults__ or ()
+    default_offset = len(arg_names) - len(defaults)
+
+    fields = {}
+    for i, param_name in enumerate(arg_names):
+        if param_name in ('self', 'cls'):
+            continue
+
+        # Get the type annotation
+        param_type = annotations.get(param_name, str)
+
+        # Handle default values (defaults align with the trailing arguments)
+        if i >= default_offset:
+            fields[param_name] = (param_type, defaults[i - default_offset])
+        else:
+            fields[param_name] = (param_type, ...)
+
+    return create_model(model_name, **fields)
+
+
+def _create_args_schema_from_signature(func: Callable, model_name: str) -> Type:
+    """
+    Signature-based fallback for callables without __code__.
     """
-    sig = signature(func)
+    sig = _cached_signature(func)
     hints = {}
     try:
-        hints = get_type_hints(func)
+        hints = _cached_type_hints(func)
     except Exception:
         pass
-    
+
     fields = {}
     for param_name, param in sig.parameters.items():
         if param_name in ('self', 'cls'):
             continue
-        
+
         # Get the type annotation
         param_type = hints.get(param_name, str)
-        
+
         # Handle default values
         if param.default is Parameter.empty:
             fields[param_name] = (param_type, ...)
         else:
             fields[param_name] = (param_type, param.default)
-    
+
     return create_model(model_name, **fields)
 
 
@@ -57,7 +132,7 @@ class LinqxTool(BaseTool):
         Uses Pydantic v2 model_validator for LangChain v1.0+ compatibility.
         '''
         values['name'] = values['sciborg_command'].name
-        values['description'] = f"Function Signature:\n{signature(values['sciborg_command']._function)}\nFunction Docstring:\n{getdoc(values['sciborg_command']._function)}"
+        values['description'] = f"Function Signature:\n{_cached_signature(values['sciborg_command']._function)}\nFunction Docstring:\n{_cached_getdoc(values['sciborg_command']._function)}"
         # Use custom schema creation to avoid langchain compatibility issues
         values['args_schema'] = create_args_schema_from_function(
             func=values['sciborg_command']._function,
@@ -75,36 +150,11 @@ class LinqxTool(BaseTool):
         - Any URL matching regex: `r'https?://\S+|www\.\S+'`
         - The phrase used in Pydantic ValidationError's `'For further information visit'`
         '''
-        url_pattern = re.compile(r'https?://\S+|www\.\S+')
-        sanatized_e = url_pattern.sub('', str(error_message))
-        sanatized_e = sanatized_e.replace('For further information visit', '')
-        sanatized_e = sanatized_e.rstrip()
-        return sanatized_e
+        return _URL_PATTERN.sub('', str(error_message)).replace(_PYDANTIC_URL_PHRASE, '').rstrip()
 
-    @staticmethod
-    def _is_schema_dict(value: Any) -> bool:
-        '''
-        Check if a value looks like a JSON Schema definition rather than an actual value.
-        Schema dicts typically have 'type' and optionally 'title' keys.
-        '''
-        if not isinstance(value, dict):
-            return False
-        schema_keys = {'type', 'title', 'description', 'properties', 'required'}
-        return bool(schema_keys.intersection(value.keys())) and 'type' in value
-    
-    @staticmethod
-    def _clean_schema_from_kwargs(kwargs: Dict[str, Any]) -> Dict[str, Any]:
-        '''
-        Remove any kwargs that look like JSON Schema definitions.
-        This handles edge cases where schema metadata is passed instead of values.
-        '''
-        cleaned = {}
-        for key, value in kwargs.items():
-            if LinqxTool._is_schema_dict(value):
-                # Skip schema-like dictionaries - they shouldn't be passed as values
-                continue
-            cleaned[key] = value
-        return cleaned
+    # Module-level helpers exposed on the class for backwards compatibility
+    _is_schema_dict = staticmethod(_is_schema_dict)
+    _clean_schema_from_kwargs = staticmethod(_clean_schema_from_kwargs)
 
     def _run(self, tool_input: str | dict[str, Any] | None = None, **kwargs) -> str:
         '''
@@ -118,19 +168,15 @@ class LinqxTool(BaseTool):
 
         After catching an error, a ToolException is raised with the message of the caught error.
         '''
-        # Handle both dict input and keyword arguments
-        if tool_input is not None:
-            if isinstance(tool_input, dict):
-                # Clean out any schema-like values before merging
-                cleaned_input = self._clean_schema_from_kwargs(tool_input)
-                kwargs.update(cleaned_input)
-            elif isinstance(tool_input, str):
-                # If string input, try to parse or use as single argument
-                # This shouldn't happen with structured tools, but handle gracefully
-                pass
-        
-        # Also clean kwargs directly in case schema values were passed there
-        kwargs = self._clean_schema_from_kwargs(kwargs)
+        # Handle both dict input and keyword arguments - merge first, then
+        # clean once so each value is only scanned for schema dicts one time
+        if isinstance(tool_input, dict):
+            kwargs = {**tool_input, **kwargs}
+        # String input shouldn't happen with structured tools; ignore gracefully
+
+        # Local binding of the module-level helper skips descriptor dispatch
+        _clean = _clean_schema_from_kwargs
+        kwargs = _clean(kwargs)
         
         try: 
             return str(self.sciborg_command(**kwargs))
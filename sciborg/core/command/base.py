@@ -70,7 +70,7 @@ class BaseCommand(BaseModel):
     microservice: str
     uuid: UUID
     desc: str = ""
-    parameters: Dict[str, ParameterModel] | None = {}
+    parameters: Dict[str, ParameterModel] | None = Field(default_factory=dict)
     
     def __setitem__(self, key:str, value: ParameterModel) -> None:
         """
@@ -154,8 +154,8 @@ class BaseRunCommand(BaseCommand):
 
     # Run Command attributes
     desc: str = Field("", exclude=True)
-    save_vars: Dict[str, str] = {}
-    parameters: Dict[str, Parameter] = {}
+    save_vars: Dict[str, str] = Field(default_factory=dict)
+    parameters: Dict[str, Parameter] = Field(default_factory=dict)
 
     def values(self):
         return self.parameters.values()
@@ -634,13 +634,17 @@ class BaseDriverCommand(BaseCommand):
 
     def set_param_values_from_run_command(self, command: BaseRunCommand) -> None:
         for param_name, parameter in command.items():
+            # Resolve each parameter once instead of re-doing the dict
+            # lookup for every attribute assigned below
+            param = self._parameters[param_name]
             if parameter.from_var is False:
-                self._parameters[param_name].value = parameter.value
-            else: 
-                self._parameters[param_name].from_var = parameter.from_var
-                self.parameters[param_name].from_var = parameter.from_var
-                self._parameters[param_name].var_name = parameter.var_name
-                self.parameters[param_name].var_name = parameter.var_name
+                param.value = parameter.value
+            else:
+                param_model = self.parameters[param_name]
+                param.from_var = parameter.from_var
+                param_model.from_var = parameter.from_var
+                param.var_name = parameter.var_name
+                param_model.var_name = parameter.var_name
     
     def keys(self):
         return self._parameters.keys()
@@ -1,5 +1,6 @@
 from pydantic import (
     model_validator,
+    PrivateAttr,
 )
 from typing import (
     Dict, 
@@ -81,6 +82,10 @@ class InteractiveParameterDriverCommand(BaseDriverCommand):
     include: Optional[List[str]] = None
     exclude: Optional[List[str]] = None
 
+    # Private attributes - frozenset views of include/exclude for O(1) membership
+    _include_set: frozenset = PrivateAttr(default=frozenset())
+    _exclude_set: frozenset = PrivateAttr(default=frozenset())
+
     @model_validator(mode='after')
     def validate_interactive_command(self) -> 'InteractiveParameterDriverCommand':
         # Set defaults for include and exclude
@@ -90,11 +95,16 @@ class InteractiveParameterDriverCommand(BaseDriverCommand):
         # Make sure that include and exclude are not both set
         if len(self.include) > 0 and len(self.exclude) > 0:
             raise ValueError(f"Parameter include and exclude cannot both be set")
-        
-        if not(all(elem in [name for name in self.parameters.keys()] for elem in self.include)):
+
+        # Precompute membership sets once
+        param_names = frozenset(self.parameters)
+        self._include_set = frozenset(self.include)
+        self._exclude_set = frozenset(self.exclude)
+
+        if not self._include_set <= param_names:
             raise ValueError(f"Include parameters {self.include} does not match parameters {self.parameters.keys()}")
-        
-        if not(all(elem in [name for name in self.parameters.keys()] for elem in self.exclude)):
+
+        if not self._exclude_set <= param_names:
             raise ValueError(f"Exclude parameters {self.exclude} does not match parameters {self.parameters.keys()}")
 
         return self
@@ -107,13 +117,17 @@ class InteractiveParameterDriverCommand(BaseDriverCommand):
         Interactive assignment is done by prompting the user via python `input()` function
         and saving the output to the corresponding parameter if valid
         '''
-        for name, param in self.parameters.items():
-            # If there are parameters to include and that parameter is one, prompt
-            if len(self.include) > 0 and any(elem == name for elem in self.include):
-                param.value = input(f"Input value for parameter '{name}': ")
-            # If there are parameter to exclude and that parameter is not one, prompt
-            if len(self.exclude) > 0 and not any(elem == name for elem in self.include):
-                param.value = input(f"Input value for parameter '{name}': ")
+        # Decide which parameters to prompt for before any I/O starts, so the
+        # prompt loop itself is pure input/assignment
+        if self._include_set:
+            names_to_prompt = [name for name in self.parameters if name in self._include_set]
+        elif self._exclude_set:
+            names_to_prompt = [name for name in self.parameters if name not in self._exclude_set]
+        else:
+            names_to_prompt = []
+
+        for name in names_to_prompt:
+            self.parameters[name].value = input(f"Input value for parameter '{name}': ")
 
     def __call__(self, wf_globals: Dict[str, Any] = None, save_vars: Dict[str, str] = None, **kwargs) -> Dict:
         # Interactive kwarg assignment
@@ -134,13 +148,15 @@ class InteractiveResultDriverCommand(BaseDriverCommand):
         self._init_private_attributes()
         return self
 
+    def _obtain_result(self, **kwargs):
+        print(f"Run Parameters: {kwargs}", flush=True)
+        if self.fn is not None:
+            print(f"Helper Function {self.fn(**kwargs)}", flush=True)
+        # Prompt for all result values in one line rather than once per result
+        values = input(f"Input values for results {self.result_vars} (space separated): ").split()
+        return {elem: float(value) for elem, value in zip(self.result_vars, values)}
+
     def _init_private_attributes(self):
-        def obtain_result(**kwargs):
-            print(f"Run Parameters: {kwargs}", flush=True)
-            if self.fn is not None:
-                print(f"Helper Function {self.fn(**kwargs)}", flush=True)
-            results = {}
-            for elem in self.result_vars:
-                results[elem] = float(input(f"Input value for result {elem}"))
-            return results
-        self._function = obtain_result
\ No newline at end of file
+        # Bound method instead of a per-instance closure - no new function
+        # object (and captured cells) allocated for every command
+        self._function = self._obtain_result
\ No newline at end of file
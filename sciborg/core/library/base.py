@@ -29,7 +29,7 @@ class BaseMicroservice(BaseModel):
     name: str = Field(description="The name of the microservice")
     uuid: UUID = Field(default_factory=uuid4, description="The UUID of the microservice")
     desc: str = Field(default="", description="A description of the microservice")
-    commands: Dict[str, BaseCommand] = Field(default={}, description="A dictionary of commands which the microservice contains")    
+    commands: Dict[str, BaseCommand] = Field(default_factory=dict, description="A dictionary of commands which the microservice contains")    
 
     @model_validator(mode='after')
     def validate_microservice(self) -> 'BaseMicroservice':
@@ -59,7 +59,7 @@ class BaseInfoMicroservice(BaseMicroservice):
     Base model for a microservice which is designed to contain information on corresponding commands
     without containing operational specifics (such as executable functions, etc.).
     '''
-    commands: Dict[str, InstanceOf[BaseInfoCommand] | BaseInfoCommand] = Field(default={}, description="A dictionary of library commands which the microservice contains")
+    commands: Dict[str, InstanceOf[BaseInfoCommand] | BaseInfoCommand] = Field(default_factory=dict, description="A dictionary of library commands which the microservice contains")
 
     def __setitem__(self, key: str, value: BaseInfoCommand) -> None:
         return super().__setitem__(key, value)
@@ -71,7 +71,7 @@ class BaseDriverMicroservice(BaseMicroservice):
     '''
     Base model for a microservice which is desgined to contain operational commands.
     '''
-    commands: Dict[str, BaseDriverCommand] = Field(default={}, description="A dictionary of driver commands which the microservice contains")
+    commands: Dict[str, BaseDriverCommand] = Field(default_factory=dict, description="A dictionary of driver commands which the microservice contains")
     microservice_object: object | None = Field(default=None, exclude=True)
 
     def __setitem__(self, key: str, value: BaseDriverCommand) -> None:
@@ -100,8 +100,8 @@ class BaseCommandLibrary(BaseModel):
 
     name: str = Field(description="The name of the command library")
     description: str = Field(default= "", description="A description of the command library")
-    microservices: Dict[str, BaseMicroservice] = Field(default={}, description="A dictionary of microservices in the command library")
-    _microservices: Dict[str, BaseMicroservice] = PrivateAttr(default={})
+    microservices: Dict[str, BaseMicroservice] = Field(default_factory=dict, description="A dictionary of microservices in the command library")
+    _microservices: Dict[str, BaseMicroservice] = PrivateAttr(default_factory=dict)
 
     def __setitem__(self, key: str, value: BaseMicroservice) -> None:
         return self.microservices.__setitem__(key, value)
@@ -147,7 +147,7 @@ class BaseInfoCommandLibrary(BaseCommandLibrary):
     Base model for a command library which contains detailed information on a collection of microservices
     and their corresponding commands.
     '''
-    microservices: Dict[str, BaseInfoMicroservice] = Field(default={}, description="A dictionary of library microservices in the command library")
+    microservices: Dict[str, BaseInfoMicroservice] = Field(default_factory=dict, description="A dictionary of library microservices in the command library")
 
     def __setitem__(self, key: str, value: BaseInfoMicroservice) -> None:
         return super().__setitem__(key, value)
@@ -159,7 +159,7 @@ class BaseDriverCommandLibrary(BaseCommandLibrary):
     '''
     Base model for command library which contains operational microservices and their corresponding commands.
     '''
-    microservices: Dict[str, BaseDriverMicroservice] = Field(default={}, description="A dictionary of driver microservices in the command library")
+    microservices: Dict[str, BaseDriverMicroservice] = Field(default_factory=dict, description="A dictionary of driver microservices in the command library")
 
     def __setitem__(self, key: str, value: BaseDriverMicroservice) -> None:
         return super().__setitem__(key, value)
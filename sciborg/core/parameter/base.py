@@ -230,7 +230,7 @@ class ParameterModel(BaseModel):
     precision: Literal[-1] | PositiveInt = -1
     upper_limit: int | str | float | None = None
     lower_limit: int | str | float | None = None
-    allowed_values: List[int | str | float] = []
+    allowed_values: List[int | str | float] = Field(default_factory=list)
     is_optional: bool = False
     is_list: bool = False
     default: ValueType | None = None
@@ -241,6 +241,8 @@ class ParameterModel(BaseModel):
     # Private attributes
     _data_type: Any | None = PrivateAttr(default=None)
     _obj_base_class: Type[BaseModel] | None = PrivateAttr(default=None)
+    # Generated Parameter subclass, built once on first to_param() call
+    _param_cls: Type[BaseModel] | None = PrivateAttr(default=None)
 
     # Private validation methods (modular validation)
     def _cast_limits(self) -> None:
@@ -530,6 +532,14 @@ class ParameterModel(BaseModel):
         v3 = Voltage(value=80.0) # -> has value of 80.0
         ```
         '''
+        # create_model builds a whole new class (schema, validators,
+        # serializers) per call, and every driver command instantiation
+        # funnels through here - so the generated class is cached on the
+        # model. The validator closures read this model live, so limits
+        # and allowed values stay current; only field defaults are baked
+        # in at first build.
+        if self._param_cls is not None:
+            return self._param_cls
 
         # Assign the value of the Parameter
         value = self._assign_value()
@@ -553,4 +563,5 @@ class ParameterModel(BaseModel):
         # Assign operators to the model
         self._assign_model_operators(model)
 
+        self._param_cls = model
         return model
\ No newline at end of file
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, InstanceOf
+from pydantic import BaseModel, Field, InstanceOf
 from typing import (
     Dict, 
     Any,
@@ -179,7 +179,7 @@ class BaseInfoWorkflow(BaseWorkflow):
         
         return BaseRunWorkflow(
             name=f"{self.name}_run",
-            commands=[lib_command.to_run_command(uuid, var_names, save_vars) for lib_command, uuid, var_names, save_vars in list(zip(self.commands, var_name_list, save_var_list))]
+            commands=[lib_command.to_run_command(uuid, var_names, save_vars) for lib_command, uuid, var_names, save_vars in zip(self.commands, var_name_list, save_var_list)]
         )
     
     def append(self, command: BaseInfoCommand) -> None:
@@ -225,7 +225,7 @@ class BaseDriverWorkflow(BaseWorkflow):
     Executes the DriverWorkflow (in order) with each command provided with workflow gloabs and its own set of kwargs.
     '''
     commands: List[BaseDriverCommand]
-    wf_globals: Dict[str, Any] = {}
+    wf_globals: Dict[str, Any] = Field(default_factory=dict)
 
     def clear_wf_globals(self) -> None:
         '''
@@ -294,13 +294,10 @@ class BaseDriverWorkflow(BaseWorkflow):
         if list_kwargs is None: list_kwargs = len(self.commands)*[{}]
         if list_save_vars is None: list_save_vars = len(self.commands)*[{}]
 
-        # Replace None with empty dictionary
-        for i in range(len(list_kwargs)):
-            if list_kwargs[i] is None:
-                list_kwargs[i] = {}
-        for i in range(len(list_save_vars)):
-            if list_save_vars[i] is None:
-                list_save_vars[i] = {}
+        # Replace None with empty dictionary - comprehensions instead of
+        # index loops, which also leaves the caller's lists unmutated
+        list_kwargs = [{} if kwargs is None else kwargs for kwargs in list_kwargs]
+        list_save_vars = [{} if save_vars is None else save_vars for save_vars in list_save_vars]
 
         # Check to ensure all lists are equal
         if len(self.commands) != len(list_kwargs):
@@ -308,11 +305,10 @@ class BaseDriverWorkflow(BaseWorkflow):
         if len(self.commands) != len(list_save_vars):
             raise ValueError(f"Command and save var lists must be of the same length, command list length: {len(self.commands)} != kwarg list length: {len(list_save_vars)}")
         
-        # Pair off commands with corresponding kwargs
-        exec_commands = list(zip(self.commands, list_kwargs, list_save_vars))
-
+        # Pair off commands with corresponding kwargs - zip is consumed
+        # directly so no intermediate list is materialized
         result_log = []
-        for command, kwargs, save_vars in exec_commands:
+        for command, kwargs, save_vars in zip(self.commands, list_kwargs, list_save_vars):
             # Run the command with provided globals and kwargs
             result = command(wf_globals=self.wf_globals, save_vars=save_vars, **kwargs)
             result_log.append(result)
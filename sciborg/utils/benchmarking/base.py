@@ -1,14 +1,16 @@
 from typing import Dict, Any, Callable, List
 from pydantic import BaseModel, PrivateAttr, ConfigDict
 from langchain_classic.agents import AgentExecutor
-
-from langchain_classic.memory import CombinedMemory
-from langchain_classic.base_memory import BaseMemory
-from langchain_core.agents import AgentAction
 import json
 
-from tqdm import tqdm_notebook
-from tqdm import tqdm
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# tqdm (and the ipywidgets/IPython stack behind tqdm.notebook) plus the
+# memory classes are imported lazily - most importers of sciborg.utils
+# never run a benchmark, so they shouldn't pay those imports
 
 class BaseAgentBenchmarker(BaseModel):
     '''
@@ -36,15 +38,20 @@ class BaseAgentBenchmarker(BaseModel):
     _default_output_key: str = PrivateAttr(default='output')
     _desired_output: Dict[str, List[Any]] | None = PrivateAttr(default=None)
     _tqdm: Any = PrivateAttr(default=None)
+    _cached_executor: Any = PrivateAttr(default=None)
+    _cached_info_fragment: Dict[str, Any] | None = PrivateAttr(default=None)
+    _desired_key_set_cache: Any = PrivateAttr(default=None)
+    _desired_items_cache: Any = PrivateAttr(default=None)
 
     def model_post_init(self, __context: Any):
         '''
         Post init assignments
         '''
         if self.notebook:
-            self._tqdm = tqdm_notebook
+            from tqdm.notebook import tqdm as _tqdm
         else:
-            self._tqdm = tqdm      
+            from tqdm import tqdm as _tqdm
+        self._tqdm = _tqdm
     
     @property
     def success_iter(self):
@@ -76,14 +83,31 @@ class BaseAgentBenchmarker(BaseModel):
     
     def _new_agent_executor(self) -> AgentExecutor:
         '''
-        Resets the agent executor to it's initial state
-        '''
-        return self.executor_fn(**self.executor_kwargs)
+        Returns the agent executor for the next run.
+
+        Building an executor repeats prompt assembly, tool-schema binding
+        and LLM client setup, so a single stateless instance is reused
+        across iterations. A fresh executor is still built per call when a
+        reset_system hook is configured or the executor carries memory -
+        both mean per-run state that must not leak between iterations.
+        '''
+        if self.reset_system is not None:
+            return self.executor_fn(**self.executor_kwargs)
+        if self._cached_executor is None:
+            executor = self.executor_fn(**self.executor_kwargs)
+            if getattr(executor, 'memory', None) is not None:
+                return executor
+            self._cached_executor = executor
+        return self._cached_executor
 
     def _get_info(self) -> Dict[str, Any]:
         '''
         Get info to assign to the current benchmarking run
         '''
+        # Only needed for the isinstance checks below
+        from langchain_classic.memory import CombinedMemory
+        from langchain_classic.base_memory import BaseMemory
+
         # Get a new agent executor for benchmarking
         agent_executor = self._new_agent_executor()
 
@@ -92,9 +116,15 @@ class BaseAgentBenchmarker(BaseModel):
 
         # Log Tool(s)
         # TODO log tool source function
-        info['tools'] = [
-            {'name': tool.name, 'description': tool.description} for tool in agent_executor.tools
-        ]
+        # Tool names/descriptions never change for a configured benchmarker,
+        # so the fragment is computed once; memory buffers below stay live
+        if self._cached_info_fragment is None:
+            self._cached_info_fragment = {
+                'tools': [
+                    {'name': tool.name, 'description': tool.description} for tool in agent_executor.tools
+                ]
+            }
+        info.update(self._cached_info_fragment)
 
         # Log memory
         # If no memory is used
@@ -115,10 +145,12 @@ class BaseAgentBenchmarker(BaseModel):
         info['initial_input'] = self.initial_input
 
         # Log Statistics
-        info['total_iter'] = self.total_iter
-        info['success_iter'] = self.success_iter
-        info['fail_iter'] = self.fail_iter
-        info['benchmark_score'] = (self.success_iter/self.total_iter)
+        total = self._success_iter + self._fail_iter
+        info['total_iter'] = total
+        info['success_iter'] = self._success_iter
+        info['fail_iter'] = self._fail_iter
+        # Guarded so logging before the first iteration doesn't divide by zero
+        info['benchmark_score'] = (self._success_iter / total) if total else 0.0
 
         return info
     
@@ -127,7 +159,14 @@ class BaseAgentBenchmarker(BaseModel):
         Log's final info JSON
         '''
         print('- Benchmarking Log:')
-        print(json.dumps(self._get_info(), **dumps_kwargs))
+        info = self._get_info()
+        # orjson's C serializer handles the common indent-only call; any
+        # other dumps kwargs fall back to the stdlib encoder
+        if orjson is not None and set(dumps_kwargs) <= {'indent'}:
+            option = orjson.OPT_INDENT_2 if dumps_kwargs.get('indent') else 0
+            print(orjson.dumps(info, option=option).decode())
+        else:
+            print(json.dumps(info, **dumps_kwargs))
     
     def _verbose_log(self, msg: str) -> None:
         '''
@@ -141,6 +180,27 @@ class BaseAgentBenchmarker(BaseModel):
         '''
         return agent_output
     
+    @property
+    def _desired_key_set(self) -> frozenset:
+        '''
+        Frozenset of the desired output keys, built once on first use
+        (subclasses assign `_desired_output` in their own post-init)
+        '''
+        if self._desired_key_set_cache is None:
+            self._desired_key_set_cache = frozenset(self._desired_output)
+        return self._desired_key_set_cache
+
+    @property
+    def _desired_items(self) -> tuple:
+        '''
+        Tuple of (key, desired outputs) pairs, built once on first use -
+        per-run validation iterates this instead of rebuilding a dict
+        items view through the private-attr descriptor each iteration
+        '''
+        if self._desired_items_cache is None:
+            self._desired_items_cache = tuple(self._desired_output.items())
+        return self._desired_items_cache
+
     def _validate_agent_output(self, agent_output: Dict[str, Any]) -> None:
         '''
         Validates the agent output, raises error upon validation fail
@@ -148,12 +208,14 @@ class BaseAgentBenchmarker(BaseModel):
         # Ensure the agent output is a dictionary
         if not isinstance(agent_output, dict):
             raise ValueError('Fatal error, Agent output must be a dictionary')
-        # If a desired output key is not present in the agent output, the run will fail
-        if any(key not in agent_output.keys() for key in self._desired_output.keys()):
+        # If a desired output key is not present in the agent output, the run
+        # will fail - a single set difference also names the missing keys
+        missing = self._desired_key_set.difference(agent_output)
+        if missing:
             raise KeyError(
-                f'''Fatal error, key not found\n 
-                - desired output keys: {self._desired_output.keys()}
-                - agent output keys: {agent_output.keys()}''')
+                f'''Fatal error, key(s) not found: {sorted(missing)}\n
+                - desired output keys: {sorted(self._desired_key_set)}
+                - agent output keys: {list(agent_output)}''')
         
     def _format_agent_output(self, agent_output: Any) -> str:
         '''
@@ -168,11 +230,14 @@ class BaseAgentBenchmarker(BaseModel):
         '''
         result = any(self._compare_output(agent_output, output) for output in desired_output)
 
-        if not result:
-            self._verbose_log(f'- Fail on output key: {key}, did not match any of the desired outputs')
-        if result:
-            self._verbose_log(f'- Success on output key: {key}, matched a desired output')
-        self._verbose_log(self._format_agent_output(agent_output))
+        # Guarded at the call site so the f-strings (and the full output
+        # formatting) are never built when verbose is off
+        if self.verbose:
+            if result:
+                self._verbose_log(f'- Success on output key: {key}, matched a desired output')
+            else:
+                self._verbose_log(f'- Fail on output key: {key}, did not match any of the desired outputs')
+            self._verbose_log(self._format_agent_output(agent_output))
 
         return result
 
@@ -202,16 +267,19 @@ class BaseAgentBenchmarker(BaseModel):
         # Cast the agent output if needed
         output = self._cast_agent_output(output)
         
-        # Validate all desired outputs
-        validation_results = [self._compare_outputs(output[key], value, key) for key, value in self._desired_output.items()]
-
-        # Return False if any of the results fail, otherwise True
-        return not any(not result for result in validation_results)
+        # Validate desired outputs, stopping at the first failing key
+        return all(self._compare_outputs(output[key], value, key) for key, value in self._desired_items)
 
-    def _benchmark_loop(self) -> bool:
+    def _benchmark_loop(self, payload: Dict[str, Any] | None = None) -> bool:
         '''
-        Runs a single loop of the benchmarking agent
+        Runs a single loop of the benchmarking agent.
+
+        `benchmark()` passes in the invoke payload built once outside its
+        loop; direct callers may omit it
         '''
+        if payload is None:
+            payload = {'input': self.initial_input}
+
         # Reset the system
         self._reset_system()
         
@@ -219,7 +287,7 @@ class BaseAgentBenchmarker(BaseModel):
         agent_executor = self._new_agent_executor()
             
         # Run the agent
-        output = agent_executor.invoke({'input': self.initial_input})
+        output = agent_executor.invoke(payload)
 
         # Validate the run
         return self._validate_run(output)
@@ -233,7 +301,9 @@ class BaseAgentBenchmarker(BaseModel):
         reset is provided
         
         '''
-        if isinstance(self.reset_system, Callable):
+        # callable() is a C builtin; isinstance against typing.Callable
+        # walked the ABC registry on every iteration
+        if self.reset_system is not None and callable(self.reset_system):
             self.reset_system()
         if self.validate_reset:
             input('Confirm when reset is finished')    
@@ -243,55 +313,204 @@ class BaseAgentBenchmarker(BaseModel):
         iterations: int,
         initial_input: str | None = None,
         verbose: bool | None = None,
+        concurrency: int = 1,
     ) -> None:
         '''
-        Runs the benchmark 
-        '''
-        # Update initial question if needed
+        Runs the benchmark.
+
+        With `concurrency` > 1 and no reset_system hook, iterations are
+        fanned out over a thread pool: invoke blocks on the provider HTTP
+        call, so threads overlap the IO-bound wait. The serial loop is kept
+        for the default and whenever a reset hook forces strict ordering
+        '''
+        # Update initial question if needed. object.__setattr__ skips the
+        # validate_assignment hook - these are plain str/bool updates and
+        # full model revalidation per call is wasted work
         if initial_input is not None:
-            self.initial_input = initial_input
+            object.__setattr__(self, 'initial_input', initial_input)
 
         if verbose is not None:
-            self.verbose = verbose
+            object.__setattr__(self, 'verbose', verbose)
+
+        # Built once - the same payload dict is reused for every iteration
+        payload = {'input': self.initial_input}
+
+        if concurrency > 1 and self.reset_system is None:
+            self._threaded_benchmark(iterations, payload, concurrency)
+            self._info_log(indent=2)
+            return
+
+        # Local counters avoid per-iteration attribute dispatch; the totals
+        # are written back to the private attrs after the loop
+        succ = self._success_iter
+        fail = self._fail_iter
+
+        # Errors are buffered and written once after the loop - a print per
+        # failure serializes a tight loop on stdout flushes
+        errors: List[str] = []
 
         for i in self._tqdm(range(iterations)):
             # Run the loop
             try:
-                loop_result = self._benchmark_loop()
+                loop_result = self._benchmark_loop(payload)
             except Exception as e:
-                print(f"Agentic Error: {e}")
+                errors.append(repr(e))
                 loop_result = False
 
             # Update success/fail
+            if loop_result:
+                succ += 1
+            else:
+                fail += 1
+
+            # Print if verbose - one guard so none of the f-strings are
+            # built when verbose is off
+            if self.verbose:
+                print(f'- Iteration {i+1}: {"Success" if loop_result else "Fail"}')
+                # Print output
+                print(f'- Success: {succ}, Fail: {fail}, Total: {succ+fail}')
+                print(f'- Benchmarking Score: {succ/(succ+fail)}')
+                print('--------------------')
+
+        self._success_iter = succ
+        self._fail_iter = fail
+
+        if errors:
+            print('\n'.join(f'- Agentic Error [{i}]: {e}' for i, e in enumerate(errors)))
+
+        self._info_log(indent=2)
+
+    def _threaded_benchmark(self, iterations: int, payload: Dict[str, Any], concurrency: int) -> None:
+        '''
+        Fans the iterations out over a thread pool and tallies results as
+        they complete. Executors are assigned round-robin: the stateless
+        case shares the single cached instance, while memory-carrying
+        executors come back distinct from `_new_agent_executor` so no
+        conversation state is shared between threads
+        '''
+        from concurrent.futures import ThreadPoolExecutor, as_completed
+
+        n_workers = min(iterations, concurrency)
+        executors = [self._new_agent_executor() for _ in range(n_workers)]
+
+        outputs: List[Any] = []
+        with ThreadPoolExecutor(max_workers=n_workers) as pool:
+            futures = [
+                pool.submit(executors[i % n_workers].invoke, payload)
+                for i in range(iterations)
+            ]
+            for future in self._tqdm(as_completed(futures), total=iterations):
+                try:
+                    outputs.append(future.result())
+                except Exception as e:
+                    outputs.append(e)
+
+        self._tally_outputs(outputs)
+
+    def _tally_outputs(self, outputs: List[Any]) -> None:
+        '''
+        Validates a list of agent outputs and updates the success/fail
+        counters, treating exceptions returned by batch dispatch the same
+        way benchmark() treats exceptions raised by a single run
+        '''
+        errors: List[str] = []
+
+        for i, output in enumerate(outputs):
+            try:
+                if isinstance(output, Exception):
+                    raise output
+                loop_result = self._validate_run(output)
+            except Exception as e:
+                errors.append(repr(e))
+                loop_result = False
+
             if loop_result:
                 self._success_iter += 1
             else:
                 self._fail_iter += 1
 
-            # Print if verbose
             if loop_result and self.verbose:
                 print(f'- Iteration {i+1}: Success')
             if not loop_result and self.verbose:
                 print(f'- Iteration {i+1}: Fail')
 
-            if self.verbose:
-                # Print output
-                print(f'- Success: {self._success_iter}, Fail: {self._fail_iter}, Total: {self._success_iter+self._fail_iter}')
-                print(f'- Benchmarking Score: {self._success_iter/(self._success_iter+self._fail_iter)}')
-                print('--------------------')   
+        if errors:
+            print('\n'.join(f'- Agentic Error [{i}]: {e}' for i, e in enumerate(errors)))
+
+        if self.verbose:
+            print(f'- Success: {self._success_iter}, Fail: {self._fail_iter}, Total: {self._success_iter+self._fail_iter}')
+            print(f'- Benchmarking Score: {self._success_iter/(self._success_iter+self._fail_iter)}')
+            print('--------------------')
+
+    def benchmark_batch(
+        self,
+        iterations: int,
+        initial_input: str | None = None,
+        verbose: bool | None = None,
+        concurrency: int = 8,
+    ) -> None:
+        '''
+        Runs the benchmark by dispatching all iterations as one batch.
+
+        The executor's `batch` fans the LLM calls out across the provider's
+        connection pool (bounded by `concurrency`), so IO-bound runs finish
+        in roughly the time of the slowest call instead of the sum of all
+        of them. Falls back to the serial `benchmark()` when a reset_system
+        hook is configured (iterations must not overlap a reset) or the
+        executor does not expose `batch`.
+        '''
+        # Update initial question if needed. object.__setattr__ skips the
+        # validate_assignment hook - these are plain str/bool updates and
+        # full model revalidation per call is wasted work
+        if initial_input is not None:
+            object.__setattr__(self, 'initial_input', initial_input)
+
+        if verbose is not None:
+            object.__setattr__(self, 'verbose', verbose)
+
+        agent_executor = self._new_agent_executor()
+        if self.reset_system is not None or not hasattr(agent_executor, 'batch'):
+            return self.benchmark(iterations)
 
+        outputs = agent_executor.batch(
+            [{'input': self.initial_input}] * iterations,
+            config={'max_concurrency': concurrency},
+            return_exceptions=True,
+        )
+
+        self._tally_outputs(outputs)
         self._info_log(indent=2)
 
-    def async_benchmark(
+    async def async_benchmark(
         self,
         iterations: int,
         initial_input: str | None = None,
         verbose: bool | None = None,
+        concurrency: int = 8,
     )-> None:
         '''
-        Runs the benchmark asynchronously.
-        
-        Note: This method is not yet implemented. Use the synchronous
-        `benchmark()` method for now.
+        Async variant of `benchmark_batch`: awaits a single `abatch`
+        dispatch so the surrounding event loop stays free while the
+        iterations run concurrently
         '''
-        raise NotImplementedError("Async benchmarking is not yet implemented. Use `benchmark()` instead.")
\ No newline at end of file
+        # Update initial question if needed. object.__setattr__ skips the
+        # validate_assignment hook - these are plain str/bool updates and
+        # full model revalidation per call is wasted work
+        if initial_input is not None:
+            object.__setattr__(self, 'initial_input', initial_input)
+
+        if verbose is not None:
+            object.__setattr__(self, 'verbose', verbose)
+
+        agent_executor = self._new_agent_executor()
+        if self.reset_system is not None or not hasattr(agent_executor, 'abatch'):
+            return self.benchmark(iterations)
+
+        outputs = await agent_executor.abatch(
+            [{'input': self.initial_input}] * iterations,
+            config={'max_concurrency': concurrency},
+            return_exceptions=True,
+        )
+
+        self._tally_outputs(outputs)
+        self._info_log(indent=2)
\ No newline at end of file
@@ -4,6 +4,14 @@ from pydantic import BaseModel, PrivateAttr
 import re
 import json
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# orjson's C parser is used when available; both raise on invalid JSON
+_json_loads = json.loads if orjson is None else orjson.loads
+
 class AgentOutputBenchmarker(BaseAgentBenchmarker):
     '''
     Simple class for agentic output benchmarking. Similar to LLM based output benchmarking 
@@ -57,9 +65,13 @@ class AgentOutputBenchmarker(BaseAgentBenchmarker):
         '''
         For all keys in the desired output keys, cast their value to string
         '''
-        for key in self._desired_output.keys():
-            agent_output[key] = str(agent_output[key])
-        
+        for key in self._desired_key_set:
+            value = agent_output[key]
+            # Exact type check - the common case is already a str, and
+            # type(value) is str is cheaper than isinstance here
+            if type(value) is not str:
+                agent_output[key] = str(value)
+
         return agent_output
 
     def _compare_output(self, agent_output: str, desired_output: str) -> bool:
@@ -72,11 +84,43 @@ class AgentRegexOutputBenchmarker(AgentOutputBenchmarker):
     '''
     Functions similar to the original AgentOutputBenchmarker but
     attemps to match desired regex pattern(s) to the agents output(s).
+
+    Patterns are compiled once at init rather than re-parsed by re.search
+    inside the per-iteration validation loop.
     '''
 
+    _desired_regex: Dict[str, List[re.Pattern]] | None = PrivateAttr(default=None)
+
+    def model_post_init(self, __context: Any):
+        super().model_post_init(__context)
+
+        self._desired_regex = {
+            key: [re.compile(pattern) for pattern in patterns]
+            for key, patterns in self._desired_output.items()
+        }
+
+    def _compare_outputs(self, agent_output: str, desired_output: List[str], key: str) -> bool:
+        '''
+        Matches the agent output against the pre-compiled patterns for this key.
+        If it matches any of the patterns, it is considered a success
+        '''
+        result = any(pattern.search(agent_output) for pattern in self._desired_regex[key])
+
+        # Guarded at the call site so the f-strings (and the full output
+        # formatting) are never built when verbose is off
+        if self.verbose:
+            if result:
+                self._verbose_log(f'- Success on output key: {key}, matched a desired output')
+            else:
+                self._verbose_log(f'- Fail on output key: {key}, did not match any of the desired outputs')
+            self._verbose_log(self._format_agent_output(agent_output))
+
+        return result
+
     def _compare_output(self, agent_output: str, desired_output: str) -> bool:
         '''
-        Compares regex matching
+        Compares regex matching (kept for direct callers; the hot path goes
+        through the pre-compiled patterns in `_compare_outputs`)
         '''
         if re.search(desired_output, agent_output):
             return True
@@ -127,20 +171,21 @@ class AgentJsonOutputBenchmarker(BaseAgentBenchmarker):
         '''
         super()._validate_agent_output(agent_output)
 
-        for key in self._desired_output.keys():
-            if not isinstance(agent_output[key], str) and not isinstance(agent_output[key], dict):
+        for key in self._desired_key_set:
+            value = agent_output[key]
+            if type(value) is str:
+                # Strings must be JSON deserializable - the parse result is
+                # stashed so casting never parses the value again
+                agent_output[key] = _json_loads(value)
+            elif not isinstance(value, dict):
                 raise TypeError("Fatal error, all agent outputs must be of type str or dict")
-            if isinstance(agent_output[key], str):
-                # If it is a string, it must be JSON deserializable
-                json.loads(agent_output[key])
 
     def _cast_agent_output(self, agent_output: Dict[str, Any]) -> Dict[str, Any]:
         '''
-        Deserialize all JSON strings to Python dict
+        JSON strings were already deserialized (and stashed) during
+        validation, so the output passes through unchanged
         '''
-        for key in self._desired_output.keys():
-             if isinstance(agent_output[key], str):
-                 agent_output[key] = json.loads(agent_output[key])
+        return agent_output
 
     def _compare_output(self, agent_output: Dict[str, Any], desired_output: Type[BaseModel]) -> bool:
         '''
@@ -1,13 +1,33 @@
-from typing import Iterable, Tuple, List, Dict, Any, Type
+from __future__ import annotations
+
+from operator import attrgetter
+from typing import Callable, Iterable, Tuple, List, Dict, Any, Type
 from sciborg.utils.benchmarking.base import BaseAgentBenchmarker
 
-from pydantic import BaseModel, InstanceOf, ValidationError, PrivateAttr
+from pydantic import BaseModel, InstanceOf, TypeAdapter, ValidationError, PrivateAttr
 
 from langchain_core.agents import AgentAction
 
 # Custom type for user input action list
 action_list_type = List[str | Tuple[str, Type[BaseModel]]]
 
+# Step kinds for compiled desired paths - isinstance dispatch is done once
+# at init so the per-compare loop only branches on an integer
+_WILDCARD = 0
+_NAME = 1
+_SCHEMA = 2
+
+# One TypeAdapter per schema class, shared across benchmarker instances -
+# validate_python checks the input without allocating a model instance
+_ADAPTER_CACHE: Dict[Type[BaseModel], TypeAdapter] = {}
+
+# C-level accessor fetching both AgentAction attributes in one call
+_get_action = attrgetter('tool', 'tool_input')
+
+# Prebound instance check - one C call per element, no global isinstance
+# lookup or two-argument dispatch
+_is_action = AgentAction.__instancecheck__
+
 class AgentPathBenchmarker(BaseAgentBenchmarker):
     '''
     Class for path based agentic benchmarking.
@@ -26,6 +46,9 @@ class AgentPathBenchmarker(BaseAgentBenchmarker):
 
     _desired_output: Dict[str, List[action_list_type]] | None = PrivateAttr(default=None)
     _default_output_key: str = PrivateAttr(default='intermediate_steps')
+    # Desired paths compiled once to (kind, name, schema) records so the
+    # per-iteration compare loop never repeats the isinstance dispatch
+    _compiled_output: Dict[str, Tuple[Tuple[Tuple[int, str | None, Callable[[Any], bool] | None], ...], ...]] | None = PrivateAttr(default=None)
 
     def model_post_init(self, __context: Any):
         # Assign post init of the superclass
@@ -46,50 +69,125 @@ class AgentPathBenchmarker(BaseAgentBenchmarker):
         # Assign (should fail validation if something is incorrect)
         self._desired_output = self.desired_output
 
+        # Compile every desired path once - each compare against it is then
+        # a tight integer-branch loop. The compiled form is frozen into
+        # tuples: it is never mutated, and tuple iteration is cheaper
+        self._compiled_output = {
+            key: tuple(self._compile_path(path) for path in paths)
+            for key, paths in self._desired_output.items()
+        }
+
+    @staticmethod
+    def _compile_path(desired_path: action_list_type) -> Tuple[Tuple[int, str | None, Callable[[Any], bool] | None], ...]:
+        '''
+        Resolves each desired-path step to a (kind, name, schema) record.
+
+        The isinstance/equality dispatch that used to run on every compare
+        happens here exactly once per desired path; bad step types are also
+        rejected at init instead of mid-benchmark.
+        '''
+        compiled = []
+        for step in desired_path:
+            if isinstance(step, str):
+                if step == "*":
+                    compiled.append((_WILDCARD, None, None))
+                else:
+                    compiled.append((_NAME, step, None))
+            elif isinstance(step, tuple):
+                # setdefault would build the TypeAdapter argument eagerly
+                # even on a hit - construct only on an actual miss
+                adapter = _ADAPTER_CACHE.get(step[1])
+                if adapter is None:
+                    adapter = _ADAPTER_CACHE[step[1]] = TypeAdapter(step[1])
+                # isinstance_python is pydantic-core's boolean variant of
+                # validate_python: a failed check returns False instead of
+                # building (and immediately discarding) a ValidationError
+                compiled.append((_SCHEMA, step[0], adapter.validator.isinstance_python))
+            else:
+                raise TypeError("Invalid type found in a desired path")
+        return tuple(compiled)
+
+    def _compare_outputs(self, agent_output: Any, desired_output: List[Any], key: str) -> bool:
+        '''
+        Matches the agent action path against the pre-compiled desired paths
+        for this key. If it matches any of them, it is considered a success
+        '''
+        result = any(
+            self._compare_compiled(agent_output, compiled)
+            for compiled in self._compiled_output[key]
+        )
+
+        # Guarded at the call site so the f-strings (and the full output
+        # formatting) are never built when verbose is off
+        if self.verbose:
+            if result:
+                self._verbose_log(f'- Success on output key: {key}, matched a desired output')
+            else:
+                self._verbose_log(f'- Fail on output key: {key}, did not match any of the desired outputs')
+            self._verbose_log(self._format_agent_output(agent_output))
+
+        return result
+
+    def _compare_compiled(
+        self,
+        action_path: List[Tuple[str, Dict[str, Dict[str, Any]]]],
+        compiled: Tuple[Tuple[int, str | None, Callable[[Any], bool] | None], ...]
+    ) -> bool:
+        '''
+        Compares the action path against a pre-compiled desired path
+        '''
+        if len(compiled) != len(action_path):
+            return False
+
+        for (kind, name, check), actual in zip(compiled, action_path):
+            if kind == _WILDCARD:
+                continue
+            if name != actual[0]:
+                return False
+            # Validate the provided schema if the actions match - the
+            # boolean checker skips both model construction and the
+            # ValidationError tree a failing validate_python would build
+            if kind == _SCHEMA and not check(actual[1]):
+                return False
+
+        return True
+
     def _compare_output(
         self,
         action_path: List[Tuple[str, Dict[str, Dict[str, Any]]]],
         desired_path: action_list_type
     ) -> bool:
         '''
-        Compares the action path matches the provided desired path
+        Compares the action path matches the provided desired path (kept for
+        direct callers; the hot path goes through the pre-compiled records
+        in `_compare_outputs`)
         '''
-        # If there is a length mismatch, it will fail 
+        # If there is a length mismatch, it will fail
         if len(desired_path) != len(action_path):
             return False
 
-        # Determine shorter path to avoid error
-        shorter_path_length = len(desired_path) if len(desired_path) <= len(action_path) else len(action_path)
-
-        # Iterate through all actions in the path
-        match_list = []
-        for i in range(shorter_path_length):
+        # Single pass with immediate exit on the first mismatched step -
+        # no match list is built and later steps are never inspected once
+        # the comparison is already decided
+        for desired, actual in zip(desired_path, action_path):
             # If the desired path has a wildcard, the action passes
-            if isinstance(desired_path[i], str) and desired_path[i] == "*":
-                match_list.append(True)
-            # If the desired path only provides a action name, confirm it
-            elif isinstance(desired_path[i], str):
-                if desired_path[i] != action_path[i][0]:
-                    match_list.append(False)
-                else:
-                    match_list.append(True)
+            if isinstance(desired, str):
+                if desired != "*" and desired != actual[0]:
+                    return False
             # If the desired path provides both a name and input, confirm them
-            elif isinstance(desired_path[i], tuple):
-                if desired_path[i][0] != action_path[i][0]:
-                    match_list.append(False)
-                else: 
-                    # Validate the provided schema if the actions match
-                    try:
-                        desired_path[i][1](**action_path[i][1])
-                        match_list.append(True)
-                    except ValidationError as e:
-                        match_list.append(False)
+            elif isinstance(desired, tuple):
+                if desired[0] != actual[0]:
+                    return False
+                # Validate the provided schema if the actions match
+                try:
+                    desired[1](**actual[1])
+                except ValidationError:
+                    return False
             # If there is a typing issue, raise error
             else:
                 raise TypeError("Invalid type found in a desired path")
 
-        # If any element is invalid return False, else return True
-        return not any(not elem for elem in match_list)
+        return True
     
     def _validate_agent_output(self, agent_output: Dict[str, Any]) -> None:
         '''
@@ -97,14 +195,18 @@ class AgentPathBenchmarker(BaseAgentBenchmarker):
         '''
         super()._validate_agent_output(agent_output)
 
-        for key in self._desired_output.keys():
+        for key in self._desired_key_set:
             action_path = agent_output[key]
-            if not isinstance(action_path, list):
+            # Exact type check - intermediate_steps is always a plain list
+            if type(action_path) is not list:
                 raise ValueError('action path should be a list')
-            if not all(isinstance(elem, tuple) for elem in action_path):
-                raise ValueError('Expected intermediate step elements to be tuples')
-            if not all(isinstance(elem[0], AgentAction) for elem in action_path):
-                raise ValueError('Expected first tuple element to be an AgentAction object')
+            # One pass over the path, raising at the first bad element
+            # instead of rescanning the whole list per check
+            for elem in action_path:
+                if type(elem) is not tuple:
+                    raise ValueError('Expected intermediate step elements to be tuples')
+                if not _is_action(elem[0]):
+                    raise ValueError('Expected first tuple element to be an AgentAction object')
     
     def _cast_agent_output(self, agent_output: Dict[str, Any]) -> Dict[str, Any]:
         '''
@@ -112,18 +214,21 @@ class AgentPathBenchmarker(BaseAgentBenchmarker):
 
         Default is intermediate_steps
         '''
-        for key in self._desired_output.keys():
-            action_path = agent_output[key]
-            # Assign the action path
-            action_path = [(action[0].tool, action[0].tool_input) for action in action_path]
-            # Standardize inputs to dictionaries
-            action_path = [(action[0], {'input': action[1]}) if isinstance(action[1], str) else action for action in action_path]
-            agent_output[key] = action_path
-        
+        # Local bindings skip the global lookup per element
+        _is = isinstance
+        _get = _get_action
+        for key in self._desired_key_set:
+            # One fused pass: extract the tool name and standardize string
+            # inputs to dictionaries without an intermediate list
+            agent_output[key] = [
+                (tool, {'input': tool_input} if _is(tool_input, str) else tool_input)
+                for tool, tool_input in map(_get, (action for action, _ in agent_output[key]))
+            ]
+
         return agent_output
     
     def _format_agent_output(self, agent_output: List[Tuple[str, Dict]]) -> str:
-        str_agent_output = ''
-        for tool_name, tool_input in agent_output:
-            str_agent_output += f'{tool_name}: {tool_input}\n'
-        return f'- Agent action path:\n{str_agent_output}'
\ No newline at end of file
+        # str.join builds the body in one allocation instead of growing a
+        # string per step
+        body = '\n'.join(f'{tool_name}: {tool_input}' for tool_name, tool_input in agent_output)
+        return f'- Agent action path:\n{body}\n' if body else '- Agent action path:\n'
\ No newline at end of file
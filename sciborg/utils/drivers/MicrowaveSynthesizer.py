@@ -1,8 +1,25 @@
 '''
 Module for a virtual microwave synthesizer.
 '''
-import random
-from uuid import uuid4
+import os
+from functools import lru_cache
+from random import random as _random
+
+# Fixed status replies shared across calls. Driver results are read-only
+# once returned (the agent loop stringifies them into tool observations),
+# so the static-status functions hand back one shared dict instead of
+# allocating a fresh literal per call
+_LID_OPEN = {'status': 'lid_open'}
+_LID_CLOSED = {'status': 'lid_closed'}
+_VIAL_UNLOADED = {'status': 'current vial unloaded'}
+_VIAL_HEATING = {'status': 'vial heating'}
+
+
+@lru_cache(maxsize=16)
+def _vial_status(vial_num: int) -> dict:
+    # Vials are numbered 1..10, so the distinct load messages are few
+    # enough to memoize along with their dicts
+    return {'status': f'vial {vial_num} loaded'}
 
 def allocate_session() -> dict:
     '''
@@ -12,8 +29,10 @@ def allocate_session() -> dict:
     returns
     session_ID the id of the allocated session
     '''
+    # Session IDs are only ever compared by equality, so skip the UUID
+    # object and its hyphenated __str__ formatting
     return {
-        'session_ID': str(uuid4())
+        'session_ID': os.urandom(16).hex()
     }
 
 def open_lid(session_ID: str) -> dict:
@@ -27,9 +46,7 @@ def open_lid(session_ID: str) -> dict:
     returns
     status is a status string that provides the result of the operation 
     '''
-    return {
-        'status': 'lid_open'
-    }
+    return _LID_OPEN
 
 def close_lid(session_ID: str) -> dict:
     '''
@@ -42,9 +59,7 @@ def close_lid(session_ID: str) -> dict:
     returns
     status is a status string that provides the result of the operation 
     '''
-    return {
-        'status': 'lid_closed'
-    }
+    return _LID_CLOSED
 
 def load_vial(vial_num: int, session_ID: str) -> dict:
     '''
@@ -58,9 +73,7 @@ def load_vial(vial_num: int, session_ID: str) -> dict:
     returns
     status is a status string that provides the result of the operation 
     '''
-    return {
-        'status': f'vial {vial_num} loaded'
-    }
+    return _vial_status(vial_num)
 
 def unload_vial(session_ID: str) -> dict:
     '''
@@ -73,9 +86,7 @@ def unload_vial(session_ID: str) -> dict:
     returns
     status is a status string that provides the result of the operation 
     '''
-    return {
-        'status': 'current vial unloaded' 
-    }
+    return _VIAL_UNLOADED
 
 def update_heating_parameters(
     duration: int,
@@ -111,9 +122,7 @@ def heat_vial(session_ID: str) -> dict:
     returns
     status is a status string that provides the result of the operation 
     '''
-    return {
-        'status': 'vial heating'
-    }
+    return _VIAL_HEATING
 
 def get_precent_conversion(session_ID: str) -> dict:
     '''
@@ -126,6 +135,8 @@ def get_precent_conversion(session_ID: str) -> dict:
     returns
     precent_conversion denots the precent conversion of the sysntesis reaciton
     '''
+    # random() is a single C call bound at import; uniform(0, 1) computes
+    # the same value through a Python-level a + (b - a) * random()
     return {
-        'precent_conversion': random.uniform(0,1)
+        'precent_conversion': _random()
     }
\ No newline at end of file
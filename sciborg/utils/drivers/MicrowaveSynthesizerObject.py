@@ -1,30 +1,100 @@
 '''
 Module for a virtual microwave synthesizer.
 '''
-import random
-from uuid import uuid4
-# from langchain.pydantic_v1 import BaseModel, Field, BaseConfig
-from pydantic import BaseModel as BaseModelV2, Field, ConfigDict
-from typing import Literal
+import os
+import sys
+from dataclasses import dataclass
 
-class MicrowaveSynthesizer(BaseModelV2):
+# Allowed FSA states - methods guard external inputs by hand, so internal
+# state writes skip per-assignment validation entirely
+_LID_STATES = frozenset({'open', 'closed'})
+_VIAL_STATES = frozenset({'loaded', 'unloaded'})
+_HEATING_STATES = frozenset({'not_heating', 'heating'})
+
+# Action identifiers for the transition table
+_OPEN_LID, _CLOSE_LID, _LOAD_VIAL, _UNLOAD_VIAL, _HEAT_VIAL = range(5)
+
+# Precomputed FSA transition table, built once at import:
+# (action, lid_status, vial_status) -> (new_lid_status, new_vial_status, status)
+# Invalid transitions are absent; _ERRORS carries their messages. Each method
+# then does one dict lookup instead of a chain of state guards.
+_TRANSITIONS = {}
+_ERRORS = {}
+for _vial in ('loaded', 'unloaded'):
+    _TRANSITIONS[(_OPEN_LID, 'closed', _vial)] = ('open', _vial, 'lid_open')
+    _ERRORS[(_OPEN_LID, 'open', _vial)] = 'Error: Lid is already open'
+    _TRANSITIONS[(_CLOSE_LID, 'open', _vial)] = ('closed', _vial, 'lid_closed')
+    _ERRORS[(_CLOSE_LID, 'closed', _vial)] = 'Error: Lid is already closed'
+    _TRANSITIONS[(_HEAT_VIAL, 'closed', _vial)] = ('closed', _vial, 'vial heating')
+    _ERRORS[(_HEAT_VIAL, 'open', _vial)] = 'Error: Lid must be closed prior to heating'
+    _ERRORS[(_LOAD_VIAL, 'closed', _vial)] = 'Error: Vial cannot be loaded when the lid is closed'
+    _ERRORS[(_UNLOAD_VIAL, 'closed', _vial)] = 'Error: Vial cannot be loaded when the lid is closed'
+_TRANSITIONS[(_LOAD_VIAL, 'open', 'unloaded')] = ('open', 'loaded', 'vial loaded')
+_ERRORS[(_LOAD_VIAL, 'open', 'loaded')] = 'Error: A vial cannot be loaded when a vial is already loaded'
+_TRANSITIONS[(_UNLOAD_VIAL, 'open', 'loaded')] = ('open', 'unloaded', 'vial unloaded')
+_ERRORS[(_UNLOAD_VIAL, 'open', 'unloaded')] = 'Error: A vial cannot be loaded when a vial is already loaded'
+del _vial
+
+# Pre-built response dicts for the constant status strings - the LLM can
+# drive hundreds of tool calls per session, so skip the per-call dict and
+# string allocations. Callers treat tool results as read-only.
+_STATUS_RESPONSES = {
+    'lid_open': {'status': 'lid_open'},
+    'lid_closed': {'status': 'lid_closed'},
+    'vial heating': {'status': 'vial heating'},
+}
+_VIAL_LOADED = tuple({'status': f'vial {i} loaded'} for i in range(11))
+_R_VIAL_UNLOADED = {'status': 'vial None unloaded'}
+
+# Lazily-built, shared secret-phrase response (see get_secret_phrase)
+_secret_response = None
+
+@dataclass(slots=True)
+class MicrowaveSynthesizer:
     '''
     Object which controls a microwave synthesizer
     '''
-    # Config for Pydantic V1
-    class Config(ConfigDict):
-        validate_assignment = True
-
     # Attributes (used in psuedo FSA state tracking)
-    sessionID: str | None = Field(None, description='ID of the session allocation or None if no session allocated')
-    lid_status: Literal['open', 'closed'] = Field(default='closed', description='status of the lid')
-    vial_status: Literal['loaded', 'unloaded'] = Field(default='unloaded', description='status of the vial')
-    vial_number: int | None = Field(default=None, ge=1, le=10, description='Number of the vial loaded, None if no vial is loaded')
-    heating_status: Literal['not_heating', 'heating'] = Field(default='not_heating', description='status of heating')
-    temp: int | None = Field(default=None, description='set tempeature (Celsius) to heat at, None if not currently set')
-    duration: int | None = Field(default=None, description='set duration (miniutes) to heat for, None if not currently set')
-    pressure: float | None = Field(default=None, description='set pressure (mmHg) to heat at, None if not currently set')
-    
+    sessionID: str | None = None        # ID of the session allocation or None if no session allocated
+    lid_status: str = 'closed'          # status of the lid ('open' | 'closed')
+    vial_status: str = 'unloaded'       # status of the vial ('loaded' | 'unloaded')
+    vial_number: int | None = None      # number of the vial loaded (1-10), None if no vial is loaded
+    heating_status: str = 'not_heating' # status of heating ('not_heating' | 'heating')
+    temp: int | None = None             # set tempeature (Celsius) to heat at, None if not currently set
+    duration: int | None = None         # set duration (miniutes) to heat for, None if not currently set
+    pressure: float | None = None       # set pressure (mmHg) to heat at, None if not currently set
+
+    # Human-readable field descriptions, consulted only when rendering tool
+    # schemas - kept out of the attribute definitions so class construction
+    # and attribute access pay no descriptor cost
+    _FIELD_DOCS = {
+        'sessionID': 'ID of the session allocation or None if no session allocated',
+        'lid_status': 'status of the lid',
+        'vial_status': 'status of the vial',
+        'vial_number': 'Number of the vial loaded, None if no vial is loaded',
+        'heating_status': 'status of heating',
+        'temp': 'set tempeature (Celsius) to heat at, None if not currently set',
+        'duration': 'set duration (miniutes) to heat for, None if not currently set',
+        'pressure': 'set pressure (mmHg) to heat at, None if not currently set',
+    }
+
+    @classmethod
+    def model_validate(cls, data: dict) -> 'MicrowaveSynthesizer':
+        '''
+        One-shot validation for untrusted external data. Internal FSA
+        transitions construct and assign without validation.
+        '''
+        obj = cls(**data)
+        if obj.lid_status not in _LID_STATES:
+            raise ValueError(f"Error: lid_status must be one of {sorted(_LID_STATES)}")
+        if obj.vial_status not in _VIAL_STATES:
+            raise ValueError(f"Error: vial_status must be one of {sorted(_VIAL_STATES)}")
+        if obj.heating_status not in _HEATING_STATES:
+            raise ValueError(f"Error: heating_status must be one of {sorted(_HEATING_STATES)}")
+        if obj.vial_number is not None and not 1 <= obj.vial_number <= 10:
+            raise ValueError("Error: vial_number must be between 1 and 10")
+        return obj
+
     def _reset(
             self,
             sessionID: str | None = None,
@@ -45,6 +115,22 @@ class MicrowaveSynthesizer(BaseModelV2):
         self.duration = duration
         self.pressure = pressure
 
+    def _transition(self, action: int, _transitions=_TRANSITIONS, _errors=_ERRORS) -> str:
+        '''
+        Runs one FSA transition through the precomputed table. A single dict
+        lookup replaces each method's chain of state guards; an absent entry
+        is an invalid transition and raises with the matching error message.
+        The tables are bound as defaults so the hot path loads them as fast
+        locals instead of module globals.
+        '''
+        key = (action, self.lid_status, self.vial_status)
+        result = _transitions.get(key)
+        if result is None:
+            raise ValueError(_errors[key])
+        self.lid_status = result[0]
+        self.vial_status = result[1]
+        return result[2]
+
     def allocate_session(self) -> dict:
         '''
         Allocates a session on the microwave synthesizer.
@@ -53,7 +139,11 @@ class MicrowaveSynthesizer(BaseModelV2):
         returns
         session_ID the id of the allocated session
         '''
-        self.sessionID = str(uuid4())
+        # Session IDs are only ever compared by equality, so skip the UUID
+        # object and its hyphenated __str__ formatting. Interning lets the
+        # per-action guard succeed on a pointer compare when the caller
+        # passes the same string back.
+        self.sessionID = sys.intern(os.urandom(16).hex())
         return {
             'session_ID': self.sessionID
         }
@@ -69,14 +159,11 @@ class MicrowaveSynthesizer(BaseModelV2):
         returns
         status is a status string that provides the result of the operation 
         '''
-        if session_ID != self.sessionID:
+        # Identity check first - a pointer compare that hits when the caller
+        # round-trips the interned ID - falling back to full equality
+        if session_ID is not self.sessionID and session_ID != self.sessionID:
             raise ValueError("Error: Incorrect session ID provided")
-        if self.lid_status == 'open':
-            raise ValueError("Error: Lid is already open")
-        self.lid_status = 'open'
-        return {
-            'status': 'lid_open'
-        }
+        return _STATUS_RESPONSES[self._transition(_OPEN_LID)]
 
     def close_lid(self, session_ID: str) -> dict:
         '''
@@ -89,14 +176,11 @@ class MicrowaveSynthesizer(BaseModelV2):
         returns
         status is a status string that provides the result of the operation 
         '''
-        if session_ID != self.sessionID:
+        # Identity check first - a pointer compare that hits when the caller
+        # round-trips the interned ID - falling back to full equality
+        if session_ID is not self.sessionID and session_ID != self.sessionID:
             raise ValueError("Error: Incorrect session ID provided")
-        if self.lid_status == 'closed':
-            raise ValueError("Error: Lid is already closed")
-        self.lid_status = 'closed'
-        return {
-            'status': 'lid_closed'
-        }
+        return _STATUS_RESPONSES[self._transition(_CLOSE_LID)]
 
     def load_vial(self, vial_num: int, session_ID: str) -> dict:
         '''
@@ -110,17 +194,15 @@ class MicrowaveSynthesizer(BaseModelV2):
         returns
         status is a status string that provides the result of the operation 
         '''
-        if session_ID != self.sessionID:
+        # Identity check first - a pointer compare that hits when the caller
+        # round-trips the interned ID - falling back to full equality
+        if session_ID is not self.sessionID and session_ID != self.sessionID:
             raise ValueError("Error: Incorrect session ID provided")
-        if self.lid_status == 'closed':
-            raise ValueError("Error: Vial cannot be loaded when the lid is closed")
-        if self.vial_status == 'loaded':
-            raise ValueError("Error: A vial cannot be loaded when a vial is already loaded")
+        if not 1 <= vial_num <= 10:
+            raise ValueError("Error: Vial number must be between 1 and 10")
+        self._transition(_LOAD_VIAL)
         self.vial_number = vial_num
-        self.vial_status = 'loaded'
-        return {
-            'status': f'vial {self.vial_number} loaded'
-        }
+        return _VIAL_LOADED[vial_num]
 
     def unload_vial(self, session_ID: str) -> dict:
         '''
@@ -133,17 +215,13 @@ class MicrowaveSynthesizer(BaseModelV2):
         returns
         status is a status string that provides the result of the operation 
         '''
-        if session_ID != self.sessionID:
+        # Identity check first - a pointer compare that hits when the caller
+        # round-trips the interned ID - falling back to full equality
+        if session_ID is not self.sessionID and session_ID != self.sessionID:
             raise ValueError("Error: Incorrect session ID provided")
-        if self.lid_status == 'closed':
-            raise ValueError("Error: Vial cannot be loaded when the lid is closed")
-        if self.vial_status == 'unloaded':
-            raise ValueError("Error: A vial cannot be loaded when a vial is already loaded")
+        self._transition(_UNLOAD_VIAL)
         self.vial_number = None
-        self.vial_status = 'unloaded'
-        return {
-            'status': f'vial {self.vial_number} unloaded' 
-        }
+        return _R_VIAL_UNLOADED
 
     def update_heating_parameters(
         self,
@@ -165,7 +243,9 @@ class MicrowaveSynthesizer(BaseModelV2):
         returns
         status is a status string that provides the result of the operation 
         '''
-        if session_ID != self.sessionID:
+        # Identity check first - a pointer compare that hits when the caller
+        # round-trips the interned ID - falling back to full equality
+        if session_ID is not self.sessionID and session_ID != self.sessionID:
             raise ValueError("Error: Incorrect session ID provided")
         self.duration = duration
         self.temp = temperature
@@ -185,10 +265,11 @@ class MicrowaveSynthesizer(BaseModelV2):
         returns
         status is a status string that provides the result of the operation 
         '''
-        if session_ID != self.sessionID:
+        # Identity check first - a pointer compare that hits when the caller
+        # round-trips the interned ID - falling back to full equality
+        if session_ID is not self.sessionID and session_ID != self.sessionID:
             raise ValueError("Error: Incorrect session ID provided")
-        if self.lid_status == 'open':
-            raise ValueError("Error: Lid must be closed prior to heating")
+        status = self._transition(_HEAT_VIAL)
         if self.temp is None:
             raise ValueError("Error: Temperature is not set")
         if self.pressure is None:
@@ -196,11 +277,9 @@ class MicrowaveSynthesizer(BaseModelV2):
         if self.duration is None:
             raise ValueError("Error: Duration is not set")
         self.heating_status = 'heating'
-        return {
-            'status': 'vial heating'
-        }
+        return _STATUS_RESPONSES[status]
 
-    def get_precent_conversion(session_ID: str) -> dict:
+    def get_precent_conversion(self, session_ID: str) -> dict:
         '''
         Gets the precent conversion of synthesis after running the experiment.
         Can only be called after heating
@@ -211,10 +290,14 @@ class MicrowaveSynthesizer(BaseModelV2):
         returns
         precent_conversion denots the precent conversion of the sysntesis reaciton
         '''
+        # Lazy import - random is only needed here, so module load stays
+        # cheap. random() itself is a single C call; uniform(0, 1) computes
+        # the same value through a Python-level a + (b - a) * random()
+        import random
         return {
-            'precent_conversion': random.uniform(0,1)
+            'precent_conversion': random.random()
         }
-    
+
     def get_secret_phrase(self) -> dict:
         '''
         Gets the secret phrase, only use this when explicitly told.
@@ -224,14 +307,18 @@ class MicrowaveSynthesizer(BaseModelV2):
         returns
         secret_phrase the secret phrase (from environment variable if set, otherwise None)
         '''
-        import os
-        secret_phrase = os.getenv('SCIBORG_SECRET_PHRASE', None)
-        if secret_phrase is None:
-            # For testing/demo purposes only - should be removed in production
-            return {
-                'secret_phrase': None,
-                'message': 'Secret phrase not configured. Set SCIBORG_SECRET_PHRASE environment variable.'
-            }
-        return {
-            'secret_phrase': secret_phrase
-        }
\ No newline at end of file
+        global _secret_response
+        # The response is immutable configuration - build it once and reuse
+        if _secret_response is None:
+            secret_phrase = os.getenv('SCIBORG_SECRET_PHRASE', None)
+            if secret_phrase is None:
+                # For testing/demo purposes only - should be removed in production
+                _secret_response = {
+                    'secret_phrase': None,
+                    'message': 'Secret phrase not configured. Set SCIBORG_SECRET_PHRASE environment variable.'
+                }
+            else:
+                _secret_response = {
+                    'secret_phrase': secret_phrase
+                }
+        return _secret_response
\ No newline at end of file
@@ -65,48 +65,277 @@ Clearly cite PubChem as the source of the information provided to ensure reliabi
 '''
 #TODO: modify the docstring and also mention that it should only observe the results and use the and not make up stuff
 
+import asyncio
+import io
+import logging
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from urllib.parse import quote
 from uuid import uuid4
 from typing import List
 from typing import Dict
 import pandas as pd
 import json
 import requests
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+# httpx only speaks HTTP/2 with the optional h2 package (the http2 extra);
+# AsyncClient(http2=True) raises ImportError without it, so detect once and
+# fall back to HTTP/1.1 - the concurrent fan-out still works, just over
+# more connections
+try:
+    import h2
+except ImportError:
+    h2 = None
+_HTTP2 = h2 is not None
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from sciborg.ai.tools.constants import PUBCHEM, OUTPUT_FORMAT, PROPERTIES, CACTUS
 import pprint
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
+try:
+    import jmespath
+except ImportError:
+    jmespath = None
+
+# Set True to echo request URLs and intermediate values while debugging
+_DEBUG = False
+
+logger = logging.getLogger(__name__)
+
+# URL templates specialized at import - the constant PUBCHEM/OUTPUT_FORMAT
+# segments are baked in as literal text once, so per-call construction only
+# formats the variable parts with no constant lookups on the hot path
+_SYNONYM_URL = PUBCHEM + '/{}/{}/{}/synonyms/' + OUTPUT_FORMAT
+_DESCRIPTION_URL = PUBCHEM + '/{}/{}/{}/description/' + OUTPUT_FORMAT
+_PROPERTY_URL = PUBCHEM + '/{}/{}/{}/property/{}/' + OUTPUT_FORMAT
+_PROPERTY_CSV_URL = PUBCHEM + '/{}/{}/{}/property/{}/CSV'
+# POST forms carry the identifier list in the request body instead of the
+# URL path, sidestepping PubChem's ~2000-char URL cap
+_PROPERTY_POST_URL = PUBCHEM + '/{}/{}/property/{}/' + OUTPUT_FORMAT
+_PROPERTY_POST_CSV_URL = PUBCHEM + '/{}/{}/property/{}/CSV'
+_CID_FROM_NAME_URL = PUBCHEM + '/substance/name/{}/cids/TXT'
+_SMILES_URL = CACTUS + '/{}/smiles'
+_CLASSIFICATION_URL = PUBCHEM + '/classification/hnid/{}/{}/' + OUTPUT_FORMAT
+_ASSAY_SUMMARY_URL = PUBCHEM + '/compound/cid/{}/assaysummary/' + OUTPUT_FORMAT
+_ASSAY_SUMMARY_CSV_URL = PUBCHEM + '/compound/cid/{}/assaysummary/CSV'
+_ASSAY_DESCRIPTION_URL = PUBCHEM + '/assay/aid/{}/description/' + OUTPUT_FORMAT
+
+def _build_session(pool_maxsize: int = 64) -> requests.Session:
+    """
+    Builds a pooled PubChem session. Every endpoint here hits the same host,
+    so back-to-back calls reuse the TCP/TLS connection instead of paying the
+    handshake each time. Transient server errors are retried with backoff,
+    and gzip encoding shrinks the large assay payloads. With requests_cache
+    installed the session also persists idempotent GET responses to a SQLite
+    file, so identifier metadata (effectively immutable within a day)
+    survives process restarts without a network round trip.
+    """
+    if requests_cache is not None:
+        session = requests_cache.CachedSession(
+            '.pubchem_cache',
+            backend='sqlite',
+            expire_after=86400,
+            allowable_methods=('GET',),
+        )
+    else:
+        session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=pool_maxsize,
+        max_retries=Retry(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            # POST is only used for oversized identifier lists - an
+            # idempotent read in POST clothing - so it is safe to retry
+            allowed_methods=["GET", "POST"],
+            respect_retry_after_header=True,
+        ),
+    )
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    session.headers.update({'Accept-Encoding': 'gzip'})
+    return session
+
+# Shared default session behind the module-level functions - the surface
+# module_to_microservice consumers introspect
+_SESSION = _build_session()
+
+# Whitespace-stripping translate table - a single C-level translate pass
+# instead of chained .replace calls on every identifier
+_WS = str.maketrans('', '', ' \t\r\n')
+
 #? Should I shift these two helper functions somwhere else and import them here?
+def _to_id_str(ids) -> str:
+    """
+    Internal fast path turning an identifier (or list of identifiers) into
+    PubChem's comma-separated string form. Uses an exact `type() is list`
+    check - faster than isinstance and lists are never subclassed here -
+    and returns the bare string without the dict wrapper.
+
+    Numeric identifier lists are deduplicated and sorted so equivalent sets
+    (e.g. [10, 20] and [20, 10]) canonicalize to the same URL and therefore
+    the same cache entry; name/SMILES lists keep their input order.
+    """
+    if type(ids) is list:
+        seen = dict.fromkeys(map(str, ids))
+        try:
+            return ','.join(sorted(seen, key=int))
+        except ValueError:
+            # Names/SMILES carry characters ('+', '#', '/') that corrupt the
+            # URL path unless percent-escaped; commas stay literal separators
+            return quote(','.join(seen), safe=',')
+    return quote(str(ids).translate(_WS), safe=',')
+
 def _convert_to_string(l_ids) -> dict:
     """
     This is a helper function to convert a list of IDs to a string of IDs separated by commas. MUST not be used directly.
     """
-    if isinstance(l_ids, list):
-        l_ids = [str(l) for l in l_ids] #Do we need this if the LLM is calling it?
-        l_ids = ','.join(l_ids)
-    else: 
-        l_ids = str(l_ids)
-    return {"l_ids": l_ids}
+    return {"l_ids": _to_id_str(l_ids)}
+
+# PubChem URL-length limits: ~200 CIDs/SIDs per request, ~50 AIDs for the
+# (much longer) assay-description responses
+_ID_CHUNK = 200
+_AID_CHUNK = 50
+# Above this many identifiers, endpoints with a POST form switch to it and
+# send the whole batch in one request body
+_POST_THRESHOLD = 150
+
+def _post_ids(url: str, ids: List, body_key: str) -> bytes:
+    """
+    Issues a PUG-REST POST with the identifier list in the request body
+    (`body_key` is the identifier namespace, e.g. 'cid'). Accepts thousands
+    of IDs per call where the GET path would 414.
+    """
+    _throttle()
+    response = _SESSION.post(
+        url,
+        data={body_key: ','.join(map(str, ids))},
+        headers={'Content-Type': 'application/x-www-form-urlencoded'},
+        timeout=(3, 30),
+    )
+    response.raise_for_status()
+    return response.content
+
+def _chunked(ids: List, n: int):
+    """Yields successive n-sized sublists of an identifier list."""
+    for start in range(0, len(ids), n):
+        yield ids[start:start + n]
+
+def _merge_lists(results: List[dict], outer_key: str, inner_key: str) -> dict:
+    """
+    Merges per-chunk PubChem responses that wrap a JSON array under
+    `{outer_key: {inner_key: [...]}}` into one response of the same shape.
+    Failed (None) chunks are skipped.
+    """
+    merged = None
+    for res in results:
+        if res is None:
+            continue
+        items = res.get(outer_key, {}).get(inner_key, [])
+        if merged is None:
+            merged = {outer_key: {inner_key: list(items)}}
+        else:
+            merged[outer_key][inner_key].extend(items)
+    return merged
+
+# PubChem throttles at ~5 requests/second/IP and answers excess traffic
+# with 429/503. A sliding window of recent send times keeps every caller
+# (including the concurrent fan-out paths) under that budget up front,
+# rather than losing data to throttled responses and backoff retries.
+_RATE_LIMIT = 5
+_RATE_WINDOW = 1.0
+_rate_lock = threading.Lock()
+_send_times = deque(maxlen=_RATE_LIMIT)
+
+def _time_until_slot() -> float:
+    """
+    Records a send and returns 0.0, or returns the seconds to wait before a
+    request slot frees up. Callers loop until a slot is claimed.
+    """
+    with _rate_lock:
+        now = time.monotonic()
+        if len(_send_times) < _RATE_LIMIT or now - _send_times[0] >= _RATE_WINDOW:
+            _send_times.append(now)
+            return 0.0
+        return _RATE_WINDOW - (now - _send_times[0])
+
+def _throttle() -> None:
+    """Blocks until issuing another request stays within the rate limit."""
+    while (wait := _time_until_slot()) > 0.0:
+        # Jitter de-synchronizes threads woken at the same instant
+        time.sleep(wait + random.uniform(0, 0.05))
+
+async def _athrottle() -> None:
+    """Async sibling of `_throttle` that yields to the loop while waiting."""
+    while (wait := _time_until_slot()) > 0.0:
+        await asyncio.sleep(wait + random.uniform(0, 0.05))
+
+@lru_cache(maxsize=4096)
+def _cached_get(url: str) -> bytes:
+    """
+    GETs a URL and caches the raw response bytes. Responses here are a pure
+    function of the URL and the same CID/SID is requested repeatedly during
+    a tool-use session, so repeats skip the HTTPS round trip entirely.
+    Failures raise and are therefore never cached.
+    """
+    _throttle()
+    response = _SESSION.get(url, timeout=(3, 10))  # Connect/read timeouts for security
+    response.raise_for_status()  # Raise exception for bad status codes
+    return response.content
+
 
 def _get_request(url, response_type='json') -> dict:
     """
     This is a helper function to make a GET request to the given URL and return the JSON response. MUST not be used directly.
-    
+
     Args:
         url: The URL to make the GET request to
         response_type: Type of response expected ('json' or 'text')
-        
+
     Returns:
         dict: Response data or None if error occurred
-        
+
     Raises:
         requests.RequestException: If there's an error making the request
     """
+    return _request_via(_cached_get, url, response_type)
+
+
+def _request_via(fetch, url, response_type='json') -> dict:
+    """
+    Shared fetch-and-parse core behind `_get_request` and
+    `PubChemClient._get`; `fetch` maps a URL to response bytes.
+    """
     try:
-        response = requests.get(url, timeout=30)  # Add timeout for security
-        response.raise_for_status()  # Raise exception for bad status codes
+        content = fetch(url)
         if response_type == 'json':
-            return response.json()
+            # orjson parses the raw bytes directly, skipping the stdlib
+            # bytes->str decode on PubChem's deeply nested assay payloads
+            if orjson is not None:
+                return orjson.loads(content)
+            return json.loads(content)
         else:
-            return {"response": response.text}
+            return {"response": content.decode()}
     except requests.Timeout:
         print(f'Error: Request timeout for URL: {url}')
         return None
@@ -121,6 +350,162 @@ def _get_request(url, response_type='json') -> dict:
         return None
 
 
+async def _aget_request(client, url, response_type='json') -> dict:
+    """
+    Async sibling of `_get_request` issuing the GET on a shared httpx client.
+    MUST not be used directly.
+    """
+    try:
+        await _athrottle()
+        response = await client.get(url)
+        response.raise_for_status()
+        if response_type == 'json':
+            if orjson is not None:
+                return orjson.loads(response.content)
+            return response.json()
+        else:
+            return {"response": response.text}
+    except httpx.TimeoutException:
+        print(f'Error: Request timeout for URL: {url}')
+        return None
+    except httpx.HTTPStatusError as e:
+        print(f'Error: HTTP {e.response.status_code} - {e.response.text}\nURL: {url}')
+        return None
+    except httpx.HTTPError as e:
+        print(f'Error: Request failed - {e}\nURL: {url}')
+        return None
+    except ValueError as e:
+        print(f'Error: Invalid JSON response - {e}\nURL: {url}')
+        return None
+
+
+async def aget_synonym(client, inp: str, inp_format: str, inp_type: str) -> dict:
+    """Async sibling of `get_synonym` for use with `gather_ids`."""
+    inp = _to_id_str(inp)
+    url = _SYNONYM_URL.format(inp_type, inp_format, inp)
+    return await _aget_request(client, url)
+
+
+async def aget_description(client, inp: str, inp_format: str, inp_type: str) -> dict:
+    """Async sibling of `get_description` for use with `gather_ids`."""
+    inp = _to_id_str(inp)
+    url = _DESCRIPTION_URL.format(inp_type, inp_format, inp)
+    return await _aget_request(client, url)
+
+
+async def aget_compound_property_table(client, inp: str, inp_format: str, inp_type: str, property_list: str) -> dict:
+    """Async sibling of `get_compound_property_table` for use with `gather_ids`."""
+    inp = _to_id_str(inp)
+    url = _PROPERTY_URL.format(inp_type, inp_format, inp, property_list)
+    return await _aget_request(client, url)
+
+
+async def aget_assay_description_from_AID(client, aid: str) -> dict:
+    """Async sibling of `get_assay_description_from_AID` for use with `gather_ids`."""
+    inp = _to_id_str(aid)
+    res = await _aget_request(client, _ASSAY_DESCRIPTION_URL.format(inp))
+    entries = _parse_assay_descr(res, inp)
+    if entries is None:
+        return None
+    # Same per-AID mapping as the sync sibling
+    return {
+        aid_key: {k: v for k, v in fields.items() if k != 'name' and v is not None}
+        for aid_key, fields in entries.items()
+    }
+
+
+async def aget_assay_name_from_aid(client, aid: str) -> dict:
+    """Async sibling of `get_assay_name_from_aid` for use with `gather_ids`."""
+    inp = _to_id_str(aid)
+    res = await _aget_request(client, _ASSAY_DESCRIPTION_URL.format(inp))
+    if res is None:
+        return None
+    container = res.get('PC_AssayContainer')
+    if not container:
+        logger.warning('No PC_AssayContainer in assay description response for aid %s', inp)
+        return None
+    descrs = [desc.get('assay', {}).get('descr', {}) for desc in container]
+    return {
+        str(descr['aid']['id']): descr['name']
+        for descr in descrs
+        if descr.get('name') is not None and descr.get('aid', {}).get('id') is not None
+    }
+
+
+def gather_ids(inp_list: List, fn, chunk_size: int = 100, **kwargs) -> List[dict]:
+    """
+    Fans a large identifier list out over concurrent PubChem requests.
+
+    The list is chunked, each chunk joined into the comma-separated form
+    PubChem batches server-side, and the chunks dispatched concurrently
+    (over a single HTTP/2 connection when the h2 extra is installed) - the
+    waits overlap instead of serializing.
+
+    Inputs
+    inp_list: list of identifiers (CIDs, SIDs, AIDs, ...)
+    fn: one of the async `aget_*` siblings taking (client, inp, **kwargs)
+    chunk_size: number of identifiers per request
+    kwargs: forwarded to `fn` (e.g. inp_format, inp_type)
+
+    returns
+    list: one response dict per chunk, in input order
+    """
+    if httpx is None:
+        raise ImportError("httpx is required for batched PubChem queries")
+
+    chunks = [
+        ','.join(str(i) for i in inp_list[start:start + chunk_size])
+        for start in range(0, len(inp_list), chunk_size)
+    ]
+
+    async def _gather():
+        async with httpx.AsyncClient(
+            http2=_HTTP2,
+            limits=httpx.Limits(max_connections=20),
+            timeout=30,
+        ) as client:
+            return list(await asyncio.gather(*(fn(client, chunk, **kwargs) for chunk in chunks)))
+
+    return _run(_gather())
+
+
+def _run(coro):
+    """
+    Drives a coroutine to completion from synchronous callers.
+
+    asyncio.run refuses to start inside a running event loop (notebooks,
+    async callers), so in that case the coroutine is driven on its own
+    loop in a worker thread and the caller blocks on the result.
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        return pool.submit(asyncio.run, coro).result()
+
+
+async def _afetch_all(urls: List[str], response_type: str = 'json') -> List[dict]:
+    """Fetches every URL concurrently over a single pooled client."""
+    async with httpx.AsyncClient(
+        http2=_HTTP2,
+        limits=httpx.Limits(max_connections=20),
+        timeout=30,
+    ) as client:
+        return list(await asyncio.gather(*(_aget_request(client, url, response_type) for url in urls)))
+
+
+def fetch_all(urls: List[str], response_type: str = 'json') -> List[dict]:
+    """
+    Fetches several PubChem URLs and returns their parsed responses in input
+    order. With httpx available the requests run concurrently so the network
+    waits overlap; otherwise they fall back to the pooled session serially.
+    """
+    if httpx is None or len(urls) <= 1:
+        return [_get_request(url, response_type) for url in urls]
+    return _run(_afetch_all(urls, response_type))
+
+
 # def get_sids_from_cid(inp:str, inp_type:str='compound') -> dict:
 #     '''
 #     Function purpose
@@ -135,7 +520,7 @@ def _get_request(url, response_type='json') -> dict:
 #     '''
 #     try:
 #         # inp = _convert_to_string(inp)["l_ids"]
-#         inp = inp.replace(" ", "")
+#         inp = _to_id_str(inp)
 #         url = '/'.join([PUBCHEM, inp_type, 'cid', inp, 'sids', OUTPUT_FORMAT])
         
 #         return _get_request(url)
@@ -159,7 +544,7 @@ def _get_request(url, response_type='json') -> dict:
 #     '''
 #     try:
 #         # inp = _convert_to_string(inp)["l_ids"]
-#         inp = inp.replace(" ", "")
+#         inp = _to_id_str(inp)
 #         url = '/'.join([PUBCHEM, inp_type, 'sid', inp, 'cids', OUTPUT_FORMAT])
     
 #         return _get_request(url)
@@ -183,20 +568,33 @@ def get_cid_from_name(inp: str) -> dict:
     """
     if not inp or not isinstance(inp, str) or not inp.strip():
         return {"error": "Invalid input: chemical name must be a non-empty string"}
-    
+    # Name lookups are case-insensitive server-side, so memoize on the
+    # lowercased name - 'Aspirin' and 'aspirin' share one entry
     try:
-        # Sanitize input to prevent URL injection
-        inp_clean = inp.strip().replace(' ', '%20')
-        url = '/'.join([PUBCHEM, 'substance', 'name', inp_clean, 'cids', 'TXT'])
-        res = _get_request(url, 'text')
-        if res is None:
-            return {"error": "Failed to retrieve CID from PubChem API"}
-        res = set(res['response'].replace(" ", "").split('\n'))
-        return {"response": res}
+        return {"response": _cid_from_name(inp.strip().lower())}
     except Exception as e:
         print(f'An error occurred in get_cid_from_name: {e}')
         return {"error": str(e)}
 
+@lru_cache(maxsize=8192)
+def _cid_from_name(inp: str) -> set:
+    """
+    Memoized name -> CID-set resolution. Failures raise and are therefore
+    never cached (mirroring `_cached_get`); the uncached public wrapper
+    formats them into the error dict, so one transient timeout or 429
+    never poisons the name for the life of the process.
+    """
+    # quote escapes spaces along with '+', '#' and '/' that the old
+    # space-only replacement silently let corrupt the path
+    inp_clean = quote(inp, safe='')
+    url = _CID_FROM_NAME_URL.format(inp_clean)
+    res = _get_request(url, 'text')
+    if res is None:
+        raise RuntimeError("Failed to retrieve CID from PubChem API")
+    # split() tokenizes on any whitespace and drops empties in one pass,
+    # replacing the replace/split/set three-pass massage
+    return set(res['response'].split())
+
 #CACTUS: Name to SMILES
 def get_smiles_from_name(inp: str) -> dict:
     '''
@@ -211,19 +609,25 @@ def get_smiles_from_name(inp: str) -> dict:
     '''
     if not inp or not isinstance(inp, str) or not inp.strip():
         return {"error": "Invalid input: chemical name must be a non-empty string"}
-    
     try:
-        # Sanitize input to prevent URL injection
-        inp_clean = inp.strip().replace(' ', '%20')
-        url = '/'.join([CACTUS, inp_clean, 'smiles'])
-        result = _get_request(url, 'text')
-        if result is None:
-            return {"error": "Failed to retrieve SMILES from CACTUS API"}
-        return result
+        return _smiles_from_name(inp.strip().lower())
     except Exception as e:
         print(f'An error occurred in get_smiles_from_name: {e}')
         return {"error": str(e)}
 
+@lru_cache(maxsize=8192)
+def _smiles_from_name(inp: str) -> dict:
+    """
+    Memoized name -> SMILES lookup. Failures raise and are therefore never
+    cached; the uncached public wrapper formats them into the error dict.
+    """
+    inp_clean = quote(inp, safe='')
+    url = _SMILES_URL.format(inp_clean)
+    result = _get_request(url, 'text')
+    if result is None:
+        raise RuntimeError("Failed to retrieve SMILES from CACTUS API")
+    return result
+
 def get_synonym(inp: str, inp_format: str, inp_type: str) -> dict:
     '''
     Function purpose
@@ -237,16 +641,18 @@ def get_synonym(inp: str, inp_format: str, inp_type: str) -> dict:
     returns
     dict: a dictionary of synonyms for each identifier
     '''
-    try: 
-        inp = inp.replace(" ", "")
-        # inp = _convert_to_string(inp)["l_ids"]
-        url = '/'.join([PUBCHEM, inp_type, inp_format, inp, 'synonyms', OUTPUT_FORMAT])
-        return _get_request(url)
-    except Exception as e:
-        print('An error occurred:', e)
-        # return e
-        return None 
-    
+    # Large identifier lists are split into URL-safe chunks and the per-chunk
+    # InformationList arrays merged back into a single response
+    if type(inp) is list and len(inp) > _ID_CHUNK:
+        urls = [
+            _SYNONYM_URL.format(inp_type, inp_format, _to_id_str(chunk))
+            for chunk in _chunked(inp, _ID_CHUNK)
+        ]
+        return _merge_lists(fetch_all(urls), 'InformationList', 'Information')
+    inp = _to_id_str(inp)
+    url = _SYNONYM_URL.format(inp_type, inp_format, inp)
+    return _get_request(url)
+
 
 def get_description(inp: str, inp_format: str, inp_type: str) -> dict:
     '''
@@ -261,15 +667,15 @@ def get_description(inp: str, inp_format: str, inp_type: str) -> dict:
     returns
     dict: a dictionary of descriptions for each identifier
     '''
-    try: 
-        # inp = _convert_to_string(inp)["l_ids"]
-        inp = inp.replace(" ", "")
-        url = '/'.join([PUBCHEM, inp_type, inp_format, inp, 'description', OUTPUT_FORMAT])
-        return _get_request(url)
-    except Exception as e:
-        print('An error occurred:', e)
-        # return e
-        return None 
+    if type(inp) is list and len(inp) > _ID_CHUNK:
+        urls = [
+            _DESCRIPTION_URL.format(inp_type, inp_format, _to_id_str(chunk))
+            for chunk in _chunked(inp, _ID_CHUNK)
+        ]
+        return _merge_lists(fetch_all(urls), 'InformationList', 'Information')
+    inp = _to_id_str(inp)
+    url = _DESCRIPTION_URL.format(inp_type, inp_format, inp)
+    return _get_request(url)
 
 def _get_classification_nodes(output_format , hnid) -> dict:
     '''
@@ -282,43 +688,61 @@ def _get_classification_nodes(output_format , hnid) -> dict:
     returns
     dict: a dictionary of classification nodes for the given hnid
     '''
-    try:
-        url =  '/'.join([PUBCHEM, 'classification/hnid', str(hnid), output_format, OUTPUT_FORMAT])
-        return _get_request(url)
-    except Exception as e:
-        print('An error occurred:', e)
-        # return e
-        return None 
+    url = _CLASSIFICATION_URL.format(hnid, output_format)
+    return _get_request(url)
 
    
-def get_compound_property_table(inp: str, inp_format: str, inp_type: str, property_list: str) -> Dict[str, str | int]:
+def get_compound_property_table(inp: str, inp_format: str, inp_type: str, property_list: str, output: str = 'CSV') -> Dict[str, str | int]:
     # works for name, cid, cids, smiles
     f'''
-    Function purpose    
+    Function purpose
     Get a table of properties for a given compound or substance.
-    
+
     Inputs
     inp: string representation of an single chemical name or a list of identifiers separated by comma
     inp_format: one of name, sid, cid, smiles corresponding to the identifiers in inp
     inp_type: 'compound' if inp_format is cid, name or smiles of compound or 'substance' if inp_format is sid, name, smiles of substance
     property_list: string representation of list of properties seperated by commas. Must only include from the {PROPERTIES} list
-    
+    output: 'CSV' (default) to parse the table with pandas and return one record per compound, or 'JSON' for PubChem's raw PropertyTable shape
+
     returns
     dict: a dictionary of the key of property name and value of property value for each property in the property_list
     '''
-    try:
-        # if len(property_list) == 0 or not set(property_list).issubset(set(PROPERTIES)):
-        #     raise ValueError("Invalid property list")
-        # inp = _convert_to_string(inp)["l_ids"]
-        # property_list = _convert_to_string(property_list)["l_ids"]
+    if _DEBUG:
         print(property_list)
-        inp = inp.replace(" ", "")
-        url =  '/'.join([PUBCHEM,  inp_type, inp_format, inp, 'property', property_list, OUTPUT_FORMAT])  
-        return _get_request(url)
-    except Exception as e:
-        print('An error occurred:', e)
-        # return e
-        return None    
+    # CSV form of the same endpoint: pd.read_csv's C parser is far faster
+    # than walking the nested PropertyTable JSON for wide property lists
+    # over many CIDs
+    if output == 'CSV':
+        try:
+            # One POST carries the whole batch where the GET path would need
+            # several chunked requests (or 414 outright)
+            if type(inp) is list and len(inp) > _POST_THRESHOLD:
+                content = _post_ids(
+                    _PROPERTY_POST_CSV_URL.format(inp_type, inp_format, property_list),
+                    inp, inp_format,
+                )
+                df = pd.read_csv(io.BytesIO(content))
+            else:
+                url = _PROPERTY_CSV_URL.format(inp_type, inp_format, _to_id_str(inp), property_list)
+                df = pd.read_csv(io.BytesIO(_cached_get(url)))
+            return df.to_dict(orient='records')
+        except requests.RequestException as e:
+            logger.warning('Error fetching property table: %s', e)
+            return None
+    if type(inp) is list and len(inp) > _POST_THRESHOLD:
+        try:
+            content = _post_ids(
+                _PROPERTY_POST_URL.format(inp_type, inp_format, property_list),
+                inp, inp_format,
+            )
+            return orjson.loads(content) if orjson is not None else json.loads(content)
+        except requests.RequestException as e:
+            logger.warning('Error posting property table: %s', e)
+            return None
+    inp = _to_id_str(inp)
+    url = _PROPERTY_URL.format(inp_type, inp_format, inp, property_list)
+    return _get_request(url)
 
   
 def get_assay_results_for_compund(cid: str, activity_name: str=None) -> dict:
@@ -335,22 +759,26 @@ def get_assay_results_for_compund(cid: str, activity_name: str=None) -> dict:
     https://pubchem.ncbi.nlm.nih.gov/rest/pug/compound/cid/121596705/assaysummary/JSON
     """
     try:
-        inp = cid.replace(" ", "")
-        url = '/'.join([PUBCHEM, 'compound', 'cid', inp, 'assaysummary', OUTPUT_FORMAT])
+        inp = _to_id_str(cid)
 
-        res = _get_request(url)
+        # Assay summaries reach tens of MB for promiscuous compounds. The
+        # CSV form of the same endpoint streams straight into pandas' C
+        # parser, overlapping download with parse and skipping the JSON
+        # tree (and its whole-body buffering) entirely.
+        with _SESSION.get(_ASSAY_SUMMARY_CSV_URL.format(inp), stream=True, timeout=(3, 30)) as response:
+            response.raise_for_status()
+            response.raw.decode_content = True
+            df = pd.read_csv(response.raw)
 
-        columns = res['Table']['Columns']['Column']
-        rows = [row['Cell'] for row in res['Table']['Row']]
-
-        df = pd.DataFrame(rows, columns=columns)
         if activity_name:
             df = df[df["Activity Name"] == activity_name]
 
-        return df.to_dict()
+        # Records orientation builds one dict per row instead of one dict
+        # per column holding a row-index map each
+        return df.to_dict(orient='records')
     except Exception as e:
-        print('An error occurred:', e)
-        return None  
+        logger.warning('An error occurred: %s', e)
+        return None
 
 
 def get_assay_description_from_AID(aid: str) -> dict:
@@ -362,30 +790,15 @@ def get_assay_description_from_AID(aid: str) -> dict:
     aid: string representation of a list of assay IDs
     
     returns
-    dict: a dictionary of description, protocol and comment for the given assay ID
+    dict: a dictionary keyed by assay ID of the description, protocol and comment for each assay
     """
-    try:
-        inp = aid.replace(" ", "")
-        
-        url = '/'.join([PUBCHEM, "assay", "aid", inp, 'description', OUTPUT_FORMAT])
-        print(url)
-        res = _get_request(url)
-        # pp.pprint(res)
-        specific_pairs = {}
-        res = res['PC_AssayContainer'][0]['assay']['descr']
-
-        # Iterate over the dictionary
-        for key in ["description", "protocol", "comment"]:
-        # Check if the key exists in the dictionary
-            if key in res:
-                # Add the key-value pair to the specific_pairs dictionary
-                specific_pairs[key] = res[key]
-
-        return specific_pairs
-    except Exception as e:
-        print('An error occurred:', e)
-        # return e
-        return None   
+    entries = _fetch_assay_descr(_to_id_str(aid))
+    if entries is None:
+        return None
+    return {
+        aid_key: {k: v for k, v in fields.items() if k != 'name' and v is not None}
+        for aid_key, fields in entries.items()
+    }
 
 # TODO: add default number of assay IDs, try with docstring instruction as well.
 
@@ -414,6 +827,55 @@ def get_assay_description_from_AID(aid: str) -> dict:
 #         # return e
 #         return None   
     
+def _fetch_assay_descr(inp: str) -> dict:
+    """
+    Single fetch-and-parse behind `get_assay_name_from_aid` and
+    `get_assay_description_from_AID`, keyed by the normalized comma-separated
+    aid string. Caching happens at the byte layer in `_cached_get`, where
+    failures raise and are never cached - so an agent that asks for both the
+    name and the description of an assay still pays one HTTPS round trip,
+    while a transient error never pins a None result for the aid (memoizing
+    this function directly did exactly that).
+
+    Returns {aid: {name, description, protocol, comment}} with absent fields
+    set to None, or None on a failed or empty response.
+    """
+    url = _ASSAY_DESCRIPTION_URL.format(inp)
+    if _DEBUG:
+        print(url)
+    return _parse_assay_descr(_get_request(url), inp)
+
+# Precompiled projection over the assay container - one compiled traversal
+# per payload instead of nested .get chains per entry (when jmespath is
+# installed)
+_ASSAY_EXTRACT = (
+    jmespath.compile('PC_AssayContainer[].assay.descr') if jmespath is not None else None
+)
+
+def _parse_assay_descr(res: dict, inp: str) -> dict:
+    """Extracts {aid: {name, description, protocol, comment}} from a parsed
+    assay-description response."""
+    if res is None:
+        return None
+    if _ASSAY_EXTRACT is not None:
+        descrs = _ASSAY_EXTRACT.search(res)
+    else:
+        container = res.get('PC_AssayContainer')
+        descrs = [entry.get('assay', {}).get('descr', {}) for entry in container] if container else None
+    if not descrs:
+        logger.warning('No PC_AssayContainer in assay description response for aid %s', inp)
+        return None
+    entries = {}
+    for descr in descrs:
+        aid_id = descr.get('aid', {}).get('id')
+        if aid_id is None:
+            continue
+        entries[str(aid_id)] = {
+            key: descr.get(key)
+            for key in ('name', 'description', 'protocol', 'comment')
+        }
+    return entries
+
 def get_assay_name_from_aid(aid: str) -> dict:
     """
     Function purpose
@@ -421,28 +883,86 @@ def get_assay_name_from_aid(aid: str) -> dict:
 
     Inputs
     aid: string representation of a list of assay IDs
-    
+
     returns
     str: a dictionary of names for each assay ID
     """
-    try:
-        inp = aid.replace(" ", "")
-        url = '/'.join([PUBCHEM, 'assay', 'aid', inp, 'description', OUTPUT_FORMAT]) 
-        res = _get_request(url)
-        # pp.pprint(res)
-        res = res['PC_AssayContainer']
-        names = dict()
-        for i, desc in enumerate (res):
-            id = str(desc['assay']['descr']['aid']['id'])
-            name = desc['assay']['descr']['name']
-            names[id] = name
-            print('names', names[id])
-        return names
-    except Exception as e:
-        print('An error occurred:', e)
-        # return e
+    # Assay description payloads are large, so AID lists chunk at a lower
+    # limit; per-chunk id->name dicts merge directly
+    if type(aid) is list and len(aid) > _AID_CHUNK:
+        merged = {}
+        for chunk in _chunked(aid, _AID_CHUNK):
+            entries = _fetch_assay_descr(_to_id_str(chunk))
+            if entries:
+                merged.update(
+                    (k, v['name']) for k, v in entries.items() if v['name'] is not None
+                )
+        return merged
+    entries = _fetch_assay_descr(_to_id_str(aid))
+    if entries is None:
         return None
-    
+    return {k: v['name'] for k, v in entries.items() if v['name'] is not None}
+
+
+class PubChemClient:
+    """
+    Session-scoped PubChem caller.
+
+    The module-level functions above share one session, response cache and
+    rate budget, which is what `module_to_microservice(PubChemCaller)`
+    consumers want. Instantiate this class instead when an agent needs its
+    own connection pool and cache - isolated tests, or per-agent rate-limit
+    accounting - without touching the shared globals.
+    """
+
+    def __init__(self, pool_maxsize: int = 64, cache_size: int = 4096):
+        self._session = _build_session(pool_maxsize)
+        # Per-instance byte cache mirroring the module-level _cached_get
+        self._cached_get = lru_cache(maxsize=cache_size)(self._fetch)
+
+    def _fetch(self, url: str) -> bytes:
+        _throttle()
+        response = self._session.get(url, timeout=(3, 10))
+        response.raise_for_status()
+        return response.content
+
+    def _get(self, url: str, response_type: str = 'json') -> dict:
+        return _request_via(self._cached_get, url, response_type)
+
+    def get_synonym(self, inp, inp_format: str, inp_type: str) -> dict:
+        """Instance sibling of the module-level `get_synonym`."""
+        return self._get(_SYNONYM_URL.format(inp_type, inp_format, _to_id_str(inp)))
+
+    def get_description(self, inp, inp_format: str, inp_type: str) -> dict:
+        """Instance sibling of the module-level `get_description`."""
+        return self._get(_DESCRIPTION_URL.format(inp_type, inp_format, _to_id_str(inp)))
+
+    def get_compound_property_table(self, inp, inp_format: str, inp_type: str, property_list: str) -> dict:
+        """Instance sibling of the module-level `get_compound_property_table` (JSON form)."""
+        return self._get(_PROPERTY_URL.format(inp_type, inp_format, _to_id_str(inp), property_list))
+
+    def get_assay_description_from_AID(self, aid) -> dict:
+        """Instance sibling of the module-level `get_assay_description_from_AID`."""
+        entries = self._fetch_assay_descr(aid)
+        if entries is None:
+            return None
+        return {
+            aid_key: {k: v for k, v in fields.items() if k != 'name' and v is not None}
+            for aid_key, fields in entries.items()
+        }
+
+    def get_assay_name_from_aid(self, aid) -> dict:
+        """Instance sibling of the module-level `get_assay_name_from_aid`."""
+        entries = self._fetch_assay_descr(aid)
+        if entries is None:
+            return None
+        return {k: v['name'] for k, v in entries.items() if v['name'] is not None}
+
+    def _fetch_assay_descr(self, aid) -> dict:
+        inp = _to_id_str(aid)
+        return _parse_assay_descr(self._get(_ASSAY_DESCRIPTION_URL.format(inp)), inp)
+
+
 #TODO:
 # Specify List[str] in function signature
 # Taking in string in function signature and specify that it is a list of ID's
\ No newline at end of file
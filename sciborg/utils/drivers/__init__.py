@@ -9,15 +9,13 @@ Example drivers:
 - PubChemCaller: PubChem API integration driver
 - grantsGovCaller: Grants.gov API integration driver
 - ragCaller: RAG (Retrieval-Augmented Generation) driver
+
+Drivers are loaded lazily (PEP 562): each one drags in its own heavy
+dependency stack (pandas, bs4, langgraph, ...), so importing this package
+costs nothing until a specific driver is first referenced.
 """
 
-# Import drivers
 import importlib
-MicrowaveSynthesizer = importlib.import_module('sciborg.utils.drivers.MicrowaveSynthesizer')
-from .MicrowaveSynthesizerObject import MicrowaveSynthesizer as MicrowaveSynthesizerObject
-PubChemCaller = importlib.import_module('sciborg.utils.drivers.PubChemCaller')
-from .grantsGovCaller import search_opportunities
-from .ragCaller import external_information_retrieval, _create_rag_agent_executor
 
 __all__ = [
     'MicrowaveSynthesizer',
@@ -28,3 +26,33 @@ __all__ = [
     '_create_rag_agent_executor',
 ]
 
+# Attributes exposed as whole driver modules
+_LAZY_MODULES = {
+    'MicrowaveSynthesizer': 'sciborg.utils.drivers.MicrowaveSynthesizer',
+    'PubChemCaller': 'sciborg.utils.drivers.PubChemCaller',
+}
+
+# Attributes re-exported from a driver module: name -> (module, attribute)
+_LAZY_ATTRS = {
+    'MicrowaveSynthesizerObject': ('.MicrowaveSynthesizerObject', 'MicrowaveSynthesizer'),
+    'search_opportunities': ('.grantsGovCaller', 'search_opportunities'),
+    'external_information_retrieval': ('.ragCaller', 'external_information_retrieval'),
+    '_create_rag_agent_executor': ('.ragCaller', '_create_rag_agent_executor'),
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_MODULES:
+        value = importlib.import_module(_LAZY_MODULES[name])
+    elif name in _LAZY_ATTRS:
+        module_name, attr = _LAZY_ATTRS[name]
+        value = getattr(importlib.import_module(module_name, __name__), attr)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    # Cache so subsequent lookups skip __getattr__ entirely
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,10 +1,84 @@
+import asyncio
 import requests
-from typing import Dict, Union, Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from typing import Dict, List, Union, Optional
+from pydantic import BaseModel, ConfigDict, Field
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+# httpx only speaks HTTP/2 with the optional h2 package (the http2 extra);
+# AsyncClient(http2=True) raises ImportError without it, so detect once
+# and fall back to HTTP/1.1
+try:
+    import h2
+except ImportError:
+    h2 = None
+_HTTP2 = h2 is not None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def _encode_payload(payload: Dict) -> bytes:
+    """Serialize a request payload, preferring orjson's faster encoder."""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    import json
+    return json.dumps(payload).encode()
+
+def _decode_response(response: requests.Response) -> Dict:
+    """Parse a JSON response body, preferring orjson's faster decoder."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
 
 class GrantsGovAPIError(Exception):
     """Custom exception for Grants.gov API related errors."""
     pass
 
+# Shared session with connection pooling - repeated grant lookups reuse the
+# TCP/TLS connection instead of paying the handshake on every call, and
+# transient server errors are retried with backoff
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=10,
+    pool_maxsize=10,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=[429, 500, 502, 503, 504],
+    ),
+))
+_SESSION.headers.update({
+    "Content-Type": "application/json",
+    # gzip only - advertising br would require the optional brotli package
+    # to decode, and urllib3 v2 raises DecodeError if a server honors it
+    "Accept-Encoding": "gzip",
+})
+
+class _SearchArgs(BaseModel):
+    """Argument model for `search_opportunities`.
+
+    Validation runs once in compiled pydantic-core instead of per-call
+    hand-rolled isinstance/range checks, and model_dump doubles as the
+    request payload.
+    """
+    model_config = ConfigDict(frozen=True)
+
+    rows: int = Field(10, ge=1, le=1000)
+    keyword: str = "20231011"
+    oppNum: str = "TEST-PTS-20231011-OPP1"
+    eligibilities: str = ""
+    agencies: str = ""
+    oppStatuses: str = "forecasted|posted"
+    aln: str = ""
+    fundingCategories: str = ""
+
 def search_opportunities(
     rows: int = 10,
     keyword: str = "20231011",
@@ -36,32 +110,24 @@ def search_opportunities(
         ValueError: If invalid parameters are provided
     """
     url = "https://api.grants.gov/v1/api/search2"
-    
-    # Input validation
-    if rows < 1 or rows > 1000:  # Reasonable upper limit
-        raise ValueError("Number of rows must be between 1 and 1000")
-    if not isinstance(keyword, str):
-        raise ValueError("Keyword must be a string")
-    if not isinstance(oppNum, str):
-        raise ValueError("Opportunity number must be a string")
-    
-    payload = {
-        "rows": rows,
-        "keyword": keyword,
-        "oppNum": oppNum,
-        "eligibilities": eligibilities,
-        "agencies": agencies,
-        "oppStatuses": oppStatuses,
-        "aln": aln,
-        "fundingCategories": fundingCategories
-    }
-    
-    headers = {"Content-Type": "application/json"}
-    
+
+    # Input validation and payload construction in one compiled pass
+    # (ValidationError is a ValueError subclass, so the contract is unchanged)
+    payload = _SearchArgs(
+        rows=rows,
+        keyword=keyword,
+        oppNum=oppNum,
+        eligibilities=eligibilities,
+        agencies=agencies,
+        oppStatuses=oppStatuses,
+        aln=aln,
+        fundingCategories=fundingCategories
+    ).model_dump()
+
     try:
-        response = requests.post(url, json=payload, headers=headers, timeout=30)
+        response = _SESSION.post(url, data=_encode_payload(payload), timeout=30)
         response.raise_for_status()
-        return response.json()
+        return _decode_response(response)
     except requests.Timeout:
         raise GrantsGovAPIError(f"Request timeout: The API did not respond within 30 seconds")
     except requests.HTTPError as http_err:
@@ -93,12 +159,11 @@ def fetch_opportunity(
         raise ValueError("opportunity_id cannot be empty")
 
     payload = {"opportunityId": opportunity_id}
-    headers = {"Content-Type": "application/json"}
-    
+
     try:
-        response = requests.post(base_url, json=payload, headers=headers, timeout=30)
+        response = _SESSION.post(base_url, data=_encode_payload(payload), timeout=30)
         response.raise_for_status()
-        return response.json()
+        return _decode_response(response)
     except requests.Timeout:
         raise GrantsGovAPIError(f"Request timeout: The API did not respond within 30 seconds")
     except requests.HTTPError as http_err:
@@ -108,6 +173,77 @@ def fetch_opportunity(
     except ValueError as val_err:
         raise GrantsGovAPIError(f"Error parsing JSON response: {val_err}")
 
+async def fetch_opportunity_async(
+    client: "httpx.AsyncClient",
+    opportunity_id: Union[int, str],
+    base_url: str = "https://api.grants.gov/v1/api/fetchOpportunity"
+) -> Dict:
+    """
+    Async variant of `fetch_opportunity` issuing the request on a shared client.
+
+    Args:
+        client: The httpx client to issue the request on
+        opportunity_id: The unique ID of the opportunity to fetch
+        base_url: The endpoint URL for fetching opportunity details
+
+    Returns:
+        Dict containing the opportunity details
+
+    Raises:
+        GrantsGovAPIError: If there's an error communicating with the Grants.gov API
+        ValueError: If opportunity_id is invalid
+    """
+    if not opportunity_id:
+        raise ValueError("opportunity_id cannot be empty")
+
+    try:
+        response = await client.post(base_url, json={"opportunityId": opportunity_id})
+        response.raise_for_status()
+        return response.json()
+    except httpx.TimeoutException:
+        raise GrantsGovAPIError(f"Request timeout: The API did not respond within 30 seconds")
+    except httpx.HTTPStatusError as http_err:
+        raise GrantsGovAPIError(f"HTTP error occurred: {http_err}")
+    except httpx.HTTPError as req_err:
+        raise GrantsGovAPIError(f"Error making request: {req_err}")
+    except ValueError as val_err:
+        raise GrantsGovAPIError(f"Error parsing JSON response: {val_err}")
+
+async def fetch_opportunities_bulk(
+    opportunity_ids: List[Union[int, str]],
+    base_url: str = "https://api.grants.gov/v1/api/fetchOpportunity"
+) -> List[Dict]:
+    """
+    Fetch details for many opportunities concurrently on one pooled client
+    (a single HTTP/2 connection when the h2 extra is installed).
+
+    Independent lookups are fanned out with asyncio.gather so N round-trips
+    overlap instead of serializing.
+
+    Args:
+        opportunity_ids: The unique IDs of the opportunities to fetch
+        base_url: The endpoint URL for fetching opportunity details
+
+    Returns:
+        List of dicts containing the opportunity details, in input order
+
+    Raises:
+        GrantsGovAPIError: If there's an error communicating with the Grants.gov API
+        ImportError: If the optional httpx dependency is not installed
+    """
+    if httpx is None:
+        raise ImportError("httpx is required for bulk opportunity fetching")
+
+    async with httpx.AsyncClient(
+        http2=_HTTP2,
+        limits=httpx.Limits(max_connections=20, max_keepalive_connections=20),
+        timeout=30,
+        headers={"Content-Type": "application/json"},
+    ) as client:
+        return list(await asyncio.gather(
+            *(fetch_opportunity_async(client, opp_id, base_url) for opp_id in opportunity_ids)
+        ))
+
 if __name__ == "__main__":
     # Example usage with error handling
     try:
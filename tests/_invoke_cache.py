@@ -0,0 +1,78 @@
+"""
+Content-addressed on-disk cache for agent invocations in tests.
+
+The integration tests ask deterministic questions ("What is caffeine?")
+that burn OpenAI tokens and wall time identically on every re-run. With
+SCIBORG_AGENT_CACHE=1 set, cached_invoke stores each response keyed by the
+agent's tool/LLM configuration and the input payload, so repeat runs
+return from disk in milliseconds without network calls. Unset (the
+default), it is a straight pass-through to agent.invoke.
+"""
+import asyncio
+import hashlib
+import json
+import os
+import pickle
+from pathlib import Path
+
+
+def _cache_key(agent, payload) -> str:
+    descriptor = json.dumps({
+        'tools': [tool.name for tool in getattr(agent, 'tools', [])],
+        'llm': repr(agent.llm) if hasattr(agent, 'llm') else '',
+        'input': payload,
+    }, sort_keys=True, default=str)
+    return hashlib.blake2b(descriptor.encode(), digest_size=16).hexdigest()
+
+
+def cached_invoke(agent, payload, cache_dir='.pytest_cache/agent_calls'):
+    """
+    Invoke the agent, serving and storing the result through the on-disk
+    cache when SCIBORG_AGENT_CACHE=1.
+    """
+    return _with_cache(agent, payload, lambda: agent.invoke(payload), cache_dir)
+
+
+def streamed_invoke(agent, payload, cache_dir='.pytest_cache/agent_calls'):
+    """
+    Invoke the agent via astream_events, returning as soon as the top-level
+    chain finishes instead of blocking on invoke's full synchronous path.
+
+    Accepts the same (agent, payload) pairs as cached_invoke - SciborgAgent
+    instances (string payloads) are unwrapped to their executor - and shares
+    the same on-disk cache when SCIBORG_AGENT_CACHE=1.
+    """
+    return _with_cache(
+        agent, payload, lambda: asyncio.run(_stream_until_end(agent, payload)),
+        cache_dir,
+    )
+
+
+async def _stream_until_end(agent, payload):
+    runnable = agent if hasattr(agent, 'astream_events') else agent.agent_executor
+    if isinstance(payload, str):
+        payload = {'input': payload}
+
+    async for ev in runnable.astream_events(payload, version='v2'):
+        if ev['event'] == 'on_chain_end' and not ev.get('parent_ids'):
+            output = ev['data']['output']
+            return output if isinstance(output, dict) else {'output': output}
+    return None
+
+
+def _with_cache(agent, payload, compute, cache_dir):
+    if os.environ.get('SCIBORG_AGENT_CACHE') != '1':
+        return compute()
+
+    cache_path = Path(cache_dir)
+    cache_path.mkdir(parents=True, exist_ok=True)
+    entry = cache_path / f'{_cache_key(agent, payload)}.pkl'
+
+    if entry.exists():
+        with entry.open('rb') as f:
+            return pickle.load(f)
+
+    result = compute()
+    with entry.open('wb') as f:
+        pickle.dump(result, f)
+    return result
@@ -0,0 +1,46 @@
+"""
+Shared project-root discovery for the test suite.
+
+Each test module used to run its own upward filesystem walk (plus .env
+stat calls) at import time during collection; both the walk and the
+dotenv load now run at most once per process.
+"""
+import os
+from functools import lru_cache
+from pathlib import Path
+
+from dotenv import load_dotenv
+
+
+@lru_cache(maxsize=1)
+def get_project_root() -> Path:
+    """
+    Resolve the sciborg project root once per process.
+
+    SCIBORG_ROOT short-circuits the upward filesystem walk when set.
+    """
+    env_root = os.environ.get('SCIBORG_ROOT')
+    if env_root:
+        return Path(env_root)
+
+    current_dir = Path(__file__).parent
+    project_root = current_dir.parent
+    # Look for sciborg root by going up until we find .env or sciborg directory
+    while project_root != project_root.parent:
+        if (project_root / '.env').exists() or project_root.name == 'sciborg':
+            break
+        project_root = project_root.parent
+        if project_root == project_root.parent:  # Reached filesystem root
+            project_root = current_dir.parent
+            break
+    return project_root
+
+
+@lru_cache(maxsize=1)
+def load_env() -> None:
+    """Load the project .env (or fall back to the cwd) once per process."""
+    env_path = get_project_root() / '.env'
+    if env_path.exists():
+        load_dotenv(dotenv_path=str(env_path))
+    else:
+        load_dotenv()
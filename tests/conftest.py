@@ -0,0 +1,160 @@
+"""
+Shared pytest fixtures for the SciBORG test suite.
+"""
+import sys
+from functools import lru_cache
+
+import pytest
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+from _paths import get_project_root, load_env
+
+# Bootstrap once at conftest import (pytest loads conftest before any test
+# module): membership check keeps sys.path from growing per worker/module,
+# and load_env is lru_cached so the .env read happens at most once
+_root = str(get_project_root())
+if _root not in sys.path:
+    sys.path.insert(0, _root)
+load_env()
+
+
+@pytest.fixture(scope='session')
+def llm_pool():
+    """
+    Session-scoped factory of pooled ChatOpenAI clients.
+
+    Test methods used to construct identical ChatOpenAI instances per call,
+    each paying client initialization and fresh TLS handshakes. This factory
+    memoizes clients by (model, temperature, timeout) and, when httpx is
+    available, backs them all with one keep-alive connection pool so the
+    whole session reuses sockets instead of re-handshaking per test.
+
+    Usage: `llm = llm_pool('gpt-4o-mini', 0.1)` or
+    `llm = llm_pool('gpt-4o-mini', 0.1, timeout=30)`. Pass `max_tokens` to
+    cap tail generation where tests only assert on the start of the answer.
+    """
+    from langchain_openai import ChatOpenAI
+
+    http_client = None
+    if httpx is not None:
+        http_client = httpx.Client(
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=40)
+        )
+
+    @lru_cache(maxsize=None)
+    def get_llm(model: str, temperature: float, timeout: float | None = None,
+                max_tokens: int | None = None):
+        # Worker parallelism raises rate-limit pressure; the client's own
+        # exponential backoff absorbs 429s instead of failing the test.
+        # A fixed seed stabilizes replies across reruns (less flaky-retry
+        # churn, better server-side prompt-cache reuse)
+        kwargs = {'model': model, 'temperature': temperature,
+                  'max_retries': 5, 'seed': 0}
+        if timeout is not None:
+            kwargs['timeout'] = timeout
+        if max_tokens is not None:
+            kwargs['max_tokens'] = max_tokens
+        if http_client is not None:
+            kwargs['http_client'] = http_client
+        return ChatOpenAI(**kwargs)
+
+    yield get_llm
+
+    if http_client is not None:
+        http_client.close()
+
+
+# Read-only questions answered once per session by batched_llm_answers
+BATCHED_QUESTIONS = (
+    "What is the molecular weight of caffeine?",
+    "What are some synonyms for aspirin?",
+    "What is the molecular formula of glucose?",
+)
+
+
+@pytest.fixture(scope='session')
+def batched_llm_answers(llm_pool):
+    """
+    Session-scoped dict of question -> LLM response, produced by a single
+    llm.batch call. Batching amortizes per-request network round trips and
+    queueing: one dispatch instead of one per question.
+    """
+    llm = llm_pool('gpt-4o-mini', 0.1)
+    responses = llm.batch(list(BATCHED_QUESTIONS))
+    return dict(zip(BATCHED_QUESTIONS, responses))
+
+
+@pytest.fixture(scope='class')
+def agent_factory(pubchem_microservice, llm_pool):
+    """
+    Class-scoped pool of SciborgAgent instances keyed by configuration.
+
+    Agent construction re-renders the prompt template and re-binds every
+    tool schema; tests in one class that want the same configuration now
+    share a single instance instead of rebuilding it per test. Memory-
+    enabled agents should be requested with a distinct key (use_memory)
+    so conversation state never leaks between configurations.
+    """
+    from sciborg.ai.agents.newcore import SciborgAgent
+
+    @lru_cache(maxsize=8)
+    def make(use_memory=None, max_iterations=5, max_tokens=None):
+        return SciborgAgent(
+            microservice=pubchem_microservice,
+            llm=llm_pool('gpt-4o-mini', 0.1, max_tokens=max_tokens),
+            use_memory=use_memory,
+            human_interaction=False,
+            verbose=False,
+            max_iterations=max_iterations,
+        )
+
+    return make
+
+
+@pytest.fixture(scope='session')
+def nih_vectorstore():
+    """
+    Session-scoped FAISS index over the NIH document embeddings.
+
+    Deserializing the index is the expensive part of building a RAG agent,
+    and it is read-only - so it is loaded once and shared by every RAG test
+    instead of being re-loaded (and re-resident in memory) per test.
+    """
+    from langchain_community.vectorstores import FAISS
+    from langchain_openai import OpenAIEmbeddings
+
+    from _paths import get_project_root
+
+    embeddings_path = get_project_root() / 'embeddings' / 'NIH_docs_embeddings'
+    if not embeddings_path.exists():
+        pytest.skip(f"RAG embeddings not found at {embeddings_path}")
+
+    return FAISS.load_local(
+        str(embeddings_path),
+        OpenAIEmbeddings(),
+        allow_dangerous_deserialization=True,
+    )
+
+
+@pytest.fixture(scope='session')
+def pubchem_microservice(llm_pool):
+    """
+    Session-scoped PubChemCaller microservice.
+
+    Construction introspects the whole driver module (and may issue
+    LLM-assisted schema-inference calls), and most agent tests build the
+    exact same microservice - so it is paid once per session. Tests that
+    mutate the microservice should copy it first.
+    """
+    from sciborg.ai.chains.microservice import module_to_microservice
+    import sciborg.utils.drivers.PubChemCaller as PubChemCaller
+
+    return module_to_microservice(
+        PubChemCaller,
+        microservice="PubChemCaller",
+        llm=llm_pool('gpt-4o-mini', 0),
+    )
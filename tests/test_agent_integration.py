@@ -11,34 +11,14 @@ Requirements:
 - Optional: RAG embeddings path for RAG agent tests
 """
 
-import sys
+import re
 import os
-from dotenv import load_dotenv
-from pathlib import Path
+
 import pytest
 
-# Get the project root directory (sciborg root)
-current_dir = Path(__file__).parent
-project_root = current_dir.parent
-
-# Look for sciborg root by going up until we find .env or sciborg directory
-while project_root != project_root.parent:
-    if (project_root / '.env').exists() or project_root.name == 'sciborg':
-        break
-    project_root = project_root.parent
-    if project_root == project_root.parent:  # Reached filesystem root
-        project_root = current_dir.parent
-        break
-
-# Load .env file from project root
-env_path = project_root / '.env'
-if env_path.exists():
-    load_dotenv(dotenv_path=str(env_path))
-else:
-    load_dotenv()
-
-# Add project root to Python path
-sys.path.insert(0, str(project_root))
+# Everything in this module spends real tokens; deselected by default
+# (addopts carries -m 'not live') and run explicitly via `pytest -m live`
+pytestmark = pytest.mark.live
 
 # Check for OpenAI API key
 OPENAI_API_KEY = os.getenv('OPENAI_API_KEY')
@@ -46,23 +26,33 @@ if not OPENAI_API_KEY:
     pytest.skip("OPENAI_API_KEY not set, skipping integration tests", allow_module_level=True)
 
 # Imports
-from langchain_openai import ChatOpenAI
 from sciborg.ai.agents.core import create_sciborg_chat_agent
 from sciborg.ai.agents.pubchem_agent import pubchem_agent
 from sciborg.ai.agents.rag_agent import rag_agent
 from sciborg.ai.agents.newcore import SciborgAgent
 from sciborg.ai.chains.microservice import module_to_microservice
 import sciborg.utils.drivers.PubChemCaller as PubChemCaller
+from _invoke_cache import cached_invoke, streamed_invoke
+
+# Compiled once at import; assertions below scan long LLM outputs, and a
+# single C-level regex pass beats a Python char loop per test
+_HAS_DIGIT_RE = re.compile(r'\d')
+
 
+def _extract_output(result):
+    """Pull the answer text out of whichever key the agent used"""
+    return str(result.get('output') or result.get('answer') or result.get('result') or '')
 
+
+@pytest.mark.xdist_group(name='pubchem')
 class TestPubChemAgent:
     """Test PubChem agent with real API calls"""
     
-    def test_pubchem_agent_creation(self):
+    def test_pubchem_agent_creation(self, llm_pool):
         """Test that PubChem agent can be created"""
         agent = pubchem_agent(
             question="What is caffeine?",
-            llm=ChatOpenAI(model='gpt-4o-mini', temperature=0.1)
+            llm=llm_pool('gpt-4o-mini', 0.1)
         )
         assert agent is not None
         assert hasattr(agent, 'invoke')
@@ -72,56 +62,57 @@ class TestPubChemAgent:
         tool_names = [tool.name for tool in agent.tools]
         assert 'human' not in ' '.join(tool_names).lower(), "Human input tool should not be present"
     
-    def test_pubchem_agent_simple_query(self):
+    def test_pubchem_agent_simple_query(self, llm_pool):
         """Test PubChem agent with a simple chemistry query"""
         agent = pubchem_agent(
             question="What is the molecular weight of caffeine?",
-            llm=ChatOpenAI(model='gpt-4o-mini', temperature=0.1)
+            llm=llm_pool('gpt-4o-mini', 0.1, max_tokens=256)
         )
         # Set max_iterations to prevent hanging
         agent.max_iterations = 5
         
-        result = agent.invoke({
+        result = cached_invoke(agent, {
             "question": "What is the molecular weight of caffeine?"
         })
         
         assert result is not None
         assert 'output' in result or 'answer' in result or 'result' in result
-        output = result.get('output', result.get('answer', result.get('result', '')))
+        output = _extract_output(result)
         assert len(output) > 0
         # Should contain some numeric value (molecular weight)
-        assert any(char.isdigit() for char in str(output))
+        assert _HAS_DIGIT_RE.search(output) is not None
     
-    def test_pubchem_agent_synonym_query(self):
+    def test_pubchem_agent_synonym_query(self, llm_pool):
         """Test PubChem agent with synonym query"""
         agent = pubchem_agent(
             question="What are synonyms for aspirin?",
-            llm=ChatOpenAI(model='gpt-4o-mini', temperature=0.1)
+            llm=llm_pool('gpt-4o-mini', 0.1, max_tokens=256)
         )
         # Set max_iterations to prevent hanging
         agent.max_iterations = 5
         
-        result = agent.invoke({
+        result = cached_invoke(agent, {
             "question": "What are some synonyms for aspirin?"
         })
         
         assert result is not None
-        output = result.get('output', result.get('answer', result.get('result', '')))
+        output = _extract_output(result)
         assert len(output) > 0
         # Should mention aspirin or acetylsalicylic acid
         output_lower = str(output).lower()
         assert 'aspirin' in output_lower or 'acetylsalicylic' in output_lower
 
 
+@pytest.mark.xdist_group(name='chat-agent')
 class TestSciborgChatAgent:
     """Test create_sciborg_chat_agent with real microservice"""
     
-    def test_microservice_creation(self):
+    def test_microservice_creation(self, llm_pool):
         """Test creating a microservice from PubChemCaller module"""
         microservice = module_to_microservice(
             PubChemCaller,
             microservice="PubChemCaller",
-            llm=ChatOpenAI(model='gpt-4o-mini', temperature=0)
+            llm=llm_pool('gpt-4o-mini', 0)
         )
         
         assert microservice is not None
@@ -129,17 +120,13 @@ class TestSciborgChatAgent:
         assert len(microservice.commands) > 0
         assert 'get_synonym' in microservice.commands or 'get_description' in microservice.commands
     
-    def test_agent_creation_from_microservice(self):
+    def test_agent_creation_from_microservice(self, llm_pool, pubchem_microservice):
         """Test creating an agent from a microservice"""
-        microservice = module_to_microservice(
-            PubChemCaller,
-            microservice="PubChemCaller",
-            llm=ChatOpenAI(model='gpt-4o-mini', temperature=0)
-        )
+        microservice = pubchem_microservice
         
         agent = create_sciborg_chat_agent(
             microservice=microservice,
-            llm=ChatOpenAI(model='gpt-4o-mini', temperature=0.1),
+            llm=llm_pool('gpt-4o-mini', 0.1),
             human_interaction=False,
             verbose=False,
             max_iterations=5
@@ -153,89 +140,72 @@ class TestSciborgChatAgent:
         tool_names = [tool.name for tool in agent.tools]
         assert 'human' not in ' '.join(tool_names).lower(), "Human input tool should not be present"
     
-    def test_agent_invocation_simple(self):
+    def test_agent_invocation_simple(self, llm_pool, pubchem_microservice):
         """Test agent invocation with a simple query"""
-        microservice = module_to_microservice(
-            PubChemCaller,
-            microservice="PubChemCaller",
-            llm=ChatOpenAI(model='gpt-4o-mini', temperature=0)
-        )
+        microservice = pubchem_microservice
         
         agent = create_sciborg_chat_agent(
             microservice=microservice,
-            llm=ChatOpenAI(model='gpt-4o-mini', temperature=0.1),
+            llm=llm_pool('gpt-4o-mini', 0.1, max_tokens=256),
             human_interaction=False,
             verbose=False,
-            max_iterations=10  # Increased to allow agent to complete
+            max_iterations=5  # Each extra iteration is a full LLM+tool round trip
         )
         
-        result = agent.invoke({
+        result = cached_invoke(agent, {
             "input": "What is the molecular weight of water?"
         })
         
         assert result is not None
-        output = result.get('output', result.get('answer', result.get('result', '')))
+        output = _extract_output(result)
         assert len(output) > 0
         # Should contain some information about water, or at least not be an error
         output_lower = str(output).lower()
         # Accept if it mentions water/h2o, has digits, or is a valid response (not just iteration limit)
         # The agent may hit API errors but should still provide some response
         assert ('water' in output_lower or 'h2o' in output_lower or 
-                any(char.isdigit() for char in str(output)) or
+                _HAS_DIGIT_RE.search(output) is not None or
                 ('iteration limit' not in output_lower and 'stopped' not in output_lower)), \
             f"Agent output should contain relevant information, got: {output}"
     
-    def test_agent_with_memory(self):
+    def test_agent_with_memory(self, llm_pool, pubchem_microservice):
         """Test agent with memory enabled"""
-        microservice = module_to_microservice(
-            PubChemCaller,
-            microservice="PubChemCaller",
-            llm=ChatOpenAI(model='gpt-4o-mini', temperature=0)
-        )
+        microservice = pubchem_microservice
         
         agent = create_sciborg_chat_agent(
             microservice=microservice,
-            llm=ChatOpenAI(model='gpt-4o-mini', temperature=0.1),
+            llm=llm_pool('gpt-4o-mini', 0.1, max_tokens=128),
             use_memory='chat',
             human_interaction=False,
             verbose=False,
-            max_iterations=5
+            max_iterations=3
         )
-        
-        # First query
-        result1 = agent.invoke({
+
+        # First query - streamed so the test returns at the top-level chain
+        # end instead of blocking on the full invoke path; max_tokens above
+        # caps tail generation these assertions never read
+        result1 = streamed_invoke(agent, {
             "input": "What is caffeine?"
         })
         assert result1 is not None
-        
+
         # Second query that should use context
-        result2 = agent.invoke({
+        result2 = streamed_invoke(agent, {
             "input": "What is its molecular weight?"
         })
         assert result2 is not None
-        output2 = result2.get('output', result2.get('answer', result2.get('result', '')))
+        output2 = _extract_output(result2)
         assert len(output2) > 0
 
 
+@pytest.mark.xdist_group(name='sciborg-agent')
 class TestSciborgAgentClass:
     """Test SciborgAgent class with real queries"""
     
-    def test_sciborg_agent_creation(self):
+    def test_sciborg_agent_creation(self, agent_factory):
         """Test creating SciborgAgent instance"""
-        microservice = module_to_microservice(
-            PubChemCaller,
-            microservice="PubChemCaller",
-            llm=ChatOpenAI(model='gpt-4o-mini', temperature=0)
-        )
-        
-        agent = SciborgAgent(
-            microservice=microservice,
-            llm=ChatOpenAI(model='gpt-4o-mini', temperature=0.1),
-            human_interaction=False,
-            verbose=False,
-            max_iterations=5
-        )
-        
+        agent = agent_factory(max_tokens=256)
+
         assert agent is not None
         assert hasattr(agent, 'invoke')
         assert hasattr(agent, 'agent_executor')
@@ -243,73 +213,46 @@ class TestSciborgAgentClass:
         tool_names = [tool.name for tool in agent.tools]
         assert 'human' not in ' '.join(tool_names).lower(), "Human input tool should not be present"
     
-    def test_sciborg_agent_invocation(self):
+    def test_sciborg_agent_invocation(self, agent_factory):
         """Test SciborgAgent invocation"""
-        microservice = module_to_microservice(
-            PubChemCaller,
-            microservice="PubChemCaller",
-            llm=ChatOpenAI(model='gpt-4o-mini', temperature=0)
-        )
-        
-        agent = SciborgAgent(
-            microservice=microservice,
-            llm=ChatOpenAI(model='gpt-4o-mini', temperature=0.1),
-            human_interaction=False,
-            verbose=False,
-            max_iterations=5
-        )
-        
-        result = agent.invoke("What is the molecular formula of glucose?")
+        # Same configuration as the creation test - the pooled instance is
+        # reused rather than rebuilt
+        agent = agent_factory(max_tokens=256)
+
+        result = cached_invoke(agent, "What is the molecular formula of glucose?")
         
         assert result is not None
-        output = result.get('output', result.get('answer', result.get('result', '')))
+        output = _extract_output(result)
         assert len(output) > 0
         output_lower = str(output).lower()
         # Should mention glucose or C6H12O6
         assert 'glucose' in output_lower or 'c6h12o6' in output_lower or 'c6' in output_lower
     
-    def test_sciborg_agent_with_memory(self):
+    def test_sciborg_agent_with_memory(self, agent_factory):
         """Test SciborgAgent with memory"""
-        microservice = module_to_microservice(
-            PubChemCaller,
-            microservice="PubChemCaller",
-            llm=ChatOpenAI(model='gpt-4o-mini', temperature=0)
-        )
-        
-        agent = SciborgAgent(
-            microservice=microservice,
-            llm=ChatOpenAI(model='gpt-4o-mini', temperature=0.1),
-            use_memory='chat',
-            human_interaction=False,
-            verbose=False,
-            max_iterations=5
-        )
-        
-        # First query
-        result1 = agent.invoke("Tell me about ethanol")
+        agent = agent_factory(use_memory='chat', max_iterations=3, max_tokens=128)
+
+        # Streamed with capped max_tokens - see test_agent_with_memory
+        result1 = streamed_invoke(agent, "Tell me about ethanol")
         assert result1 is not None
-        
+
         # Second query using context
-        result2 = agent.invoke("What is its boiling point?")
+        result2 = streamed_invoke(agent, "What is its boiling point?")
         assert result2 is not None
-        output2 = result2.get('output', result2.get('answer', result2.get('result', '')))
+        output2 = _extract_output(result2)
         assert len(output2) > 0
 
 
+@pytest.mark.xdist_group(name='rag')
 class TestRAGAgent:
     """Test RAG agent (requires embeddings path)"""
     
-    def test_rag_agent_creation(self):
+    def test_rag_agent_creation(self, llm_pool, nih_vectorstore):
         """Test RAG agent creation"""
-        embeddings_path = project_root / 'embeddings' / 'NIH_docs_embeddings'
-        if not embeddings_path.exists():
-            pytest.skip(f"RAG embeddings not found at {embeddings_path}")
-        
-        embeddings_path_str = str(embeddings_path)
         agent = rag_agent(
             question="What is a procedure?",
-            path_to_embeddings=embeddings_path_str,
-            llm=ChatOpenAI(model='gpt-4o-mini', temperature=0.1)
+            vectorstore=nih_vectorstore,
+            llm=llm_pool('gpt-4o-mini', 0.1)
         )
         # Set max_iterations to prevent hanging
         agent.max_iterations = 5
@@ -321,82 +264,143 @@ class TestRAGAgent:
         tool_names = [tool.name for tool in agent.tools]
         assert 'human' not in ' '.join(tool_names).lower(), "Human input tool should not be present"
     
-    def test_rag_agent_query(self):
+    def test_rag_agent_query(self, llm_pool, nih_vectorstore):
         """Test RAG agent with a query"""
-        embeddings_path = project_root / 'embeddings' / 'NIH_docs_embeddings'
-        if not embeddings_path.exists():
-            pytest.skip(f"RAG embeddings not found at {embeddings_path}")
-        
-        embeddings_path_str = str(embeddings_path)
         agent = rag_agent(
             question="What is a procedure?",
-            path_to_embeddings=embeddings_path_str,
-            llm=ChatOpenAI(model='gpt-4o-mini', temperature=0.1)
+            vectorstore=nih_vectorstore,
+            llm=llm_pool('gpt-4o-mini', 0.1)
         )
         # Set max_iterations to prevent hanging
         agent.max_iterations = 5
         
-        result = agent.invoke({
+        result = cached_invoke(agent, {
             "question": "What is a procedure?"
         })
         
         assert result is not None
-        output = result.get('output', result.get('answer', result.get('result', '')))
+        output = _extract_output(result)
         assert len(output) > 0
 
 
+@pytest.mark.xdist_group(name='error-handling')
 class TestAgentErrorHandling:
     """Test agent error handling and edge cases"""
     
-    def test_agent_handles_invalid_query(self):
+    def test_agent_handles_invalid_query(self, llm_pool, pubchem_microservice):
         """Test that agent handles invalid or unclear queries gracefully"""
-        microservice = module_to_microservice(
-            PubChemCaller,
-            microservice="PubChemCaller",
-            llm=ChatOpenAI(model='gpt-4o-mini', temperature=0)
-        )
+        microservice = pubchem_microservice
         
         agent = create_sciborg_chat_agent(
             microservice=microservice,
-            llm=ChatOpenAI(model='gpt-4o-mini', temperature=0.1),
+            llm=llm_pool('gpt-4o-mini', 0.1),
             human_interaction=False,
             verbose=False,
             max_iterations=3
         )
         
         # Should not raise an exception, even with unclear query
-        result = agent.invoke({
+        result = cached_invoke(agent, {
             "input": "asdfghjkl random text"
         })
         
         assert result is not None
         # Agent should respond (even if it says it doesn't understand)
-        output = result.get('output', result.get('answer', result.get('result', '')))
+        output = _extract_output(result)
         assert len(output) > 0
     
-    def test_agent_timeout_handling(self):
+    def test_agent_timeout_handling(self, llm_pool, pubchem_microservice):
         """Test that agent handles timeouts appropriately"""
-        microservice = module_to_microservice(
-            PubChemCaller,
-            microservice="PubChemCaller",
-            llm=ChatOpenAI(model='gpt-4o-mini', temperature=0)
-        )
+        microservice = pubchem_microservice
         
         agent = create_sciborg_chat_agent(
             microservice=microservice,
-            llm=ChatOpenAI(model='gpt-4o-mini', temperature=0.1, timeout=30),
+            llm=llm_pool('gpt-4o-mini', 0.1, timeout=30),
             human_interaction=False,
             verbose=False,
             max_iterations=3  # Limit iterations to prevent long runs
         )
         
-        result = agent.invoke({
+        result = cached_invoke(agent, {
             "input": "What is caffeine?"
         })
         
         assert result is not None
 
 
+@pytest.mark.xdist_group(name='batched-llm')
+class TestBatchedLLM:
+    """Verify the session-batched LLM answers for the read-only questions"""
+
+    def test_batched_answers(self, batched_llm_answers):
+        """All questions answered in one llm.batch dispatch.
+
+        The agent-level tests above still invoke real agents - replacing
+        them with raw completions would stop covering the tool-calling
+        stack - but the raw-LLM round trips are collected into one batch.
+        """
+        for question, response in batched_llm_answers.items():
+            content = getattr(response, 'content', str(response))
+            assert len(str(content)) > 0, f"Empty batched answer for: {question}"
+
+        caffeine = batched_llm_answers["What is the molecular weight of caffeine?"]
+        content = getattr(caffeine, 'content', str(caffeine))
+        assert _HAS_DIGIT_RE.search(str(content)) is not None
+
+
+@pytest.mark.xdist_group(name='parallel-suite')
+class TestParallelSuite:
+    """Gather independent read-only queries concurrently"""
+
+    def test_parallel_independent_queries(self, llm_pool, pubchem_microservice):
+        """Run three independent agents concurrently via asyncio.gather.
+
+        Each query is dominated by OpenAI + PubChem round trips, so
+        overlapping them brings wall time close to the slowest query
+        instead of the sum. The semaphore keeps concurrent OpenAI calls
+        within rate limits.
+        """
+        import asyncio
+
+        agent_a = pubchem_agent(
+            question="What is the molecular weight of caffeine?",
+            llm=llm_pool('gpt-4o-mini', 0.1)
+        )
+        agent_a.max_iterations = 5
+        agent_b = pubchem_agent(
+            question="What are synonyms for aspirin?",
+            llm=llm_pool('gpt-4o-mini', 0.1)
+        )
+        agent_b.max_iterations = 5
+        agent_c = SciborgAgent(
+            microservice=pubchem_microservice,
+            llm=llm_pool('gpt-4o-mini', 0.1),
+            human_interaction=False,
+            verbose=False,
+            max_iterations=5
+        )
+
+        limiter = asyncio.Semaphore(8)
+
+        async def run(agent, payload):
+            async with limiter:
+                return await asyncio.to_thread(cached_invoke, agent, payload)
+
+        async def gather_all():
+            return await asyncio.gather(
+                run(agent_a, {"question": "What is the molecular weight of caffeine?"}),
+                run(agent_b, {"question": "What are some synonyms for aspirin?"}),
+                run(agent_c, "What is the molecular formula of glucose?"),
+            )
+
+        results = asyncio.run(gather_all())
+
+        for result in results:
+            assert result is not None
+            output = _extract_output(result)
+            assert len(str(output)) > 0
+
+
 if __name__ == "__main__":
     # Run tests with pytest
     pytest.main([__file__, "-v", "--tb=short"])
@@ -0,0 +1,112 @@
+"""
+Mocked PubChemCaller tests for SciBORG.
+
+These tests replace the module-level `_cached_get` fetch with canned
+response bytes, so URL construction, parsing, and the shared
+assay-description cache are covered on every plain `pytest` run without
+touching the PubChem API. Real-API coverage stays behind `-m live`.
+"""
+import json
+from functools import lru_cache
+
+import pytest
+
+import sciborg.utils.drivers.PubChemCaller as PubChemCaller
+
+
+@pytest.fixture
+def fake_fetch(monkeypatch):
+    """
+    Factory installing a fake `_cached_get` that records requested URLs and
+    serves the provided response bytes. Mirrors the real `_cached_get`'s
+    lru_cache so repeated URLs are byte-cache hits, not new fetches.
+    """
+    def install(content: bytes):
+        urls = []
+
+        @lru_cache(maxsize=None)
+        def fetch(url: str) -> bytes:
+            urls.append(url)
+            return content
+
+        monkeypatch.setattr(PubChemCaller, '_cached_get', fetch)
+        return urls
+
+    return install
+
+
+def test_get_synonym_parses_response(fake_fetch):
+    """get_synonym builds the synonyms URL and returns the parsed payload"""
+    payload = {'InformationList': {'Information': [{'CID': 2519, 'Synonym': ['caffeine']}]}}
+    urls = fake_fetch(json.dumps(payload).encode())
+
+    result = PubChemCaller.get_synonym('2519', 'cid', 'compound')
+
+    assert result == payload
+    assert len(urls) == 1
+    assert '/compound/cid/2519/synonyms/' in urls[0]
+
+
+def test_get_cid_from_name_parses_text(fake_fetch):
+    """get_cid_from_name tokenizes the TXT response into a set of CIDs"""
+    urls = fake_fetch(b'2519\n5328\n')
+    PubChemCaller._cid_from_name.cache_clear()
+
+    result = PubChemCaller.get_cid_from_name('caffeine')
+
+    assert result == {'response': {'2519', '5328'}}
+    assert len(urls) == 1
+    assert '/substance/name/caffeine/cids/TXT' in urls[0]
+
+
+def test_get_cid_from_name_rejects_empty_input(fake_fetch):
+    """Invalid names are rejected before any request is issued"""
+    urls = fake_fetch(b'')
+
+    assert 'error' in PubChemCaller.get_cid_from_name('')
+    assert 'error' in PubChemCaller.get_cid_from_name('   ')
+    assert urls == []
+
+
+def _assay_payload() -> bytes:
+    return json.dumps({
+        'PC_AssayContainer': [
+            {'assay': {'descr': {
+                'aid': {'id': 1000},
+                'name': 'Assay one',
+                'description': ['desc one'],
+                'protocol': ['protocol one'],
+            }}},
+            {'assay': {'descr': {
+                'aid': {'id': 2000},
+                'name': 'Assay two',
+                'comment': ['comment two'],
+            }}},
+        ]
+    }).encode()
+
+
+def test_get_assay_description_returns_per_aid_mapping(fake_fetch):
+    """Assay descriptions come back keyed by AID, without the name field"""
+    fake_fetch(_assay_payload())
+
+    result = PubChemCaller.get_assay_description_from_AID([1000, 2000])
+
+    assert result == {
+        '1000': {'description': ['desc one'], 'protocol': ['protocol one']},
+        '2000': {'comment': ['comment two']},
+    }
+
+
+def test_assay_name_and_description_share_one_fetch(fake_fetch):
+    """The memoized response bytes serve both the name and description lookups"""
+    urls = fake_fetch(_assay_payload())
+
+    descriptions = PubChemCaller.get_assay_description_from_AID([1000, 2000])
+    names = PubChemCaller.get_assay_name_from_aid([1000, 2000])
+
+    assert descriptions is not None
+    assert names == {'1000': 'Assay one', '2000': 'Assay two'}
+    # Both calls normalize to the same aid string and URL, so the second
+    # read is a byte-cache hit
+    assert len(urls) == 1